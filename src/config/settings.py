@@ -296,8 +296,12 @@ class CanvasDownloaderConfig:
             'level': ConfigField('level', str, 'INFO', 'Logging level', allowed_values=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
             'console_output': ConfigField('console_output', bool, True, 'Enable console logging'),
             'file_output': ConfigField('file_output', bool, True, 'Enable file logging'),
+            'console_level': ConfigField('console_level', str, None, 'Console logging level (defaults to level)', allowed_values=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']),
+            'rich_tracebacks': ConfigField('rich_tracebacks', bool, False, 'Render console tracebacks with Rich'),
+            'verbose_api': ConfigField('verbose_api', bool, False, 'Log every Canvas API call (canvasapi INFO records)'),
             'max_log_size_mb': ConfigField('max_log_size_mb', int, 50, 'Maximum log file size in MB', min_value=1, max_value=1000),
             'backup_count': ConfigField('backup_count', int, 5, 'Number of log backups to keep', min_value=1, max_value=50),
+            'compress_backups': ConfigField('compress_backups', bool, False, 'Gzip rotated log files in the background'),
             'format': ConfigField('format', str, '%(asctime)s - %(name)s - %(levelname)s - %(message)s', 'Log format string')
         },
         'ui': {
@@ -567,10 +567,9 @@ class CanvasOrchestrator:
 
             self.progress_tracker.start_course(
                 course_info['name'],
-                course_id
+                course_id,
+                total_content_types=len(enabled_types)
             )
-            # Set total content types separately
-            self.progress_tracker.set_total_content_types(len(enabled_types))
 
             # Initialize course results
             course_results = {
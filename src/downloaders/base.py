@@ -506,6 +506,7 @@ class BaseDownloader(ABC, ConfigurationAccessMixin):
 
             # Process each item
             items_metadata = []
+            downloaded_bytes = 0
 
             for index, item in enumerate(items, 1):
                 try:
@@ -529,6 +530,7 @@ class BaseDownloader(ABC, ConfigurationAccessMixin):
                         # Add to file size tracking
                         if 'file_size' in download_info:
                             self.stats['total_size_bytes'] += download_info['file_size']
+                            downloaded_bytes += download_info['file_size']
                     else:
                         self.stats['skipped_items'] += 1
 
@@ -553,6 +555,10 @@ class BaseDownloader(ABC, ConfigurationAccessMixin):
                     }
                     items_metadata.append(error_metadata)
 
+            # Report downloaded bytes to the tracker in one batch
+            if self.progress_tracker and downloaded_bytes:
+                self.progress_tracker.add_downloaded_bytes(downloaded_bytes)
+
             # Save metadata
             self.save_metadata(items_metadata)
 
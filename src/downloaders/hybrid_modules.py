@@ -77,9 +77,13 @@ class HybridModulesDownloader(BaseDownloader):
         # CRITICAL FIX: Initialize web content extractor with Canvas API client
         try:
             from ..utils.web_content_extractor import create_web_content_extractor
+            cache_enabled = self.safe_config_get('performance.cache_enabled', True, bool)
+            cache_folder = Path(self.safe_config_get('paths.cache_folder', 'cache', str))
             self.web_extractor = create_web_content_extractor(
                 cookies_path=self.cookies_path,
-                canvas_client=canvas_client  # PASS CANVAS API CLIENT FOR URL RESOLUTION
+                canvas_client=canvas_client,  # PASS CANVAS API CLIENT FOR URL RESOLUTION
+                resolution_cache_path=cache_folder / 'web_resolution_cache.json' if cache_enabled else None,
+                resolution_cache_ttl_hours=self.safe_config_get('performance.cache_expiry_hours', 24, int)
             )
             self.logger.info("Web content extractor initialized successfully with Canvas API integration")
         except Exception as e:
@@ -393,65 +397,84 @@ class HybridModulesDownloader(BaseDownloader):
                              course_id=course_id,
                              module_id=module_id)
 
-            # Extract files using the FIXED web extractor (with URL resolution)
-            file_infos = self.web_extractor.extract_module_files(course_id, module_id)
+            # One HTTP session for the module page and all of its files
+            async with self.web_extractor.async_session() as http:
+                # Extract files using the FIXED web extractor (with URL resolution)
+                file_infos = await self.web_extractor.extract_module_files_async(
+                    course_id, module_id, session=http)
 
-            if not file_infos:
-                self.logger.info(f"No files found in module {module.name}")
-                return 0
+                if not file_infos:
+                    self.logger.info(f"No files found in module {module.name}")
+                    return 0
 
-            # Log URL resolution verification
-            await self._verify_url_resolution(file_infos)
+                # Log URL resolution verification
+                await self._verify_url_resolution(file_infos)
 
-            files_downloaded = 0
-
-            # Download each file
-            for file_info in file_infos:
-                try:
-                    filename = file_info.filename
-                    url = file_info.url
-
-                    # Sanitize filename
-                    safe_filename = self.sanitize_filename(filename)
-                    file_path = files_folder / safe_filename
+                files_downloaded = 0
+                pending = []
+                queued_paths = set()
 
-                    # Check if file already exists
-                    if file_path.exists():
-                        self.logger.info(f"File already exists, skipping: {filename}")
-                        files_downloaded += 1
-                        continue
+                # Pick the files that still need downloading
+                for file_info in file_infos:
+                    try:
+                        filename = file_info.filename
 
-                    self.logger.info(f"Downloading file: {filename}")
+                        # Sanitize filename
+                        safe_filename = self.sanitize_filename(filename)
+                        file_path = files_folder / safe_filename
 
-                    # Download using the resolved URL
-                    success = self.web_extractor.download_file(url, file_path)
+                        # Check if file already exists (or is already queued under the same name)
+                        if file_path in queued_paths or file_path.exists():
+                            self.logger.info(f"File already exists, skipping: {filename}")
+                            files_downloaded += 1
+                            continue
 
-                    if success:
-                        files_downloaded += 1
-                        self.logger.info(f"Successfully downloaded: {filename} ({file_path.stat().st_size} bytes)")
+                        self.logger.info(f"Downloading file: {filename}")
+                        queued_paths.add(file_path)
+                        pending.append((file_info, file_path))
 
-                        # Save file metadata
-                        metadata_file = file_path.with_suffix(file_path.suffix + '.metadata.json')
-                        file_metadata = {
-                            'filename': filename,
-                            'original_url': url,
-                            'file_type': file_info.file_type,
-                            'size': file_info.size,
-                            'content_id': file_info.content_id,
-                            'download_date': datetime.now().isoformat(),
-                            'module_name': module.name,
-                            'item_title': file_info.item_title
-                        }
-
-                        async with aiofiles.open(metadata_file, 'w', encoding='utf-8') as f:
-                            await f.write(json.dumps(file_metadata, indent=2, ensure_ascii=False))
+                    except Exception as e:
+                        self.logger.error(f"Error downloading file {file_info.filename}", exception=e)
+                        continue
 
-                    else:
-                        self.logger.warning(f"Failed to download: {filename}")
+                # Download using the resolved URLs, several at a time
+                results = await self.web_extractor.download_files_async(
+                    [(file_info.url, file_path) for file_info, file_path in pending],
+                    max_concurrent=self.parallel_downloads,
+                    session=http
+                )
 
-                except Exception as e:
-                    self.logger.error(f"Error downloading file {file_info.filename}", exception=e)
-                    continue
+                for (file_info, file_path), success in zip(pending, results):
+                    try:
+                        filename = file_info.filename
+                        url = file_info.url
+
+                        if success:
+                            files_downloaded += 1
+                            self.logger.info(f"Successfully downloaded: {filename} ({file_path.stat().st_size} bytes)")
+
+                            # Save file metadata
+                            metadata_file = file_path.with_suffix(file_path.suffix + '.metadata.json')
+                            file_metadata = {
+                                'filename': filename,
+                                'original_url': url,
+                                'file_type': file_info.file_type,
+                                'size': file_info.size,
+                                'content_id': file_info.content_id,
+                                'download_date': datetime.now().isoformat(),
+                                'module_name': module.name,
+                                'item_title': file_info.item_title
+                            }
+
+                            async with aiofiles.open(metadata_file, 'w', encoding='utf-8') as f:
+                                await f.write(json.dumps(file_metadata, indent=2, ensure_ascii=False))
+
+                        else:
+                            self.logger.warning(f"Failed to download: {filename}")
+
+                    except Exception as e:
+                        self.logger.error(f"Error downloading file {file_info.filename}", exception=e)
+                        continue
 
             self.logger.info(f"Web extraction completed for module {module.name}: {files_downloaded} files downloaded")
             return files_downloaded
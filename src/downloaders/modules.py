@@ -44,6 +44,15 @@ from canvasapi.exceptions import CanvasException
 from .base import BaseDownloader, DownloadError
 from ..utils.logger import get_logger
 
+# Browser-like headers for the web scraping session, shared by all instances
+_WEB_SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+}
+
 
 class ModulesDownloader(BaseDownloader):
     """
@@ -98,13 +107,7 @@ class ModulesDownloader(BaseDownloader):
         """Set up web session with cookies for scraping."""
         try:
             # Set headers
-            self.web_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-            })
+            self.web_session.headers.update(_WEB_SESSION_HEADERS)
 
             # Load cookies if available
             if self.cookies_path.exists():
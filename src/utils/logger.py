@@ -34,18 +34,28 @@ Usage:
 """
 
 import os
+import re
 import sys
+import asyncio
 import json
+import socket
 import time
+import queue
+import atexit
+import gzip
+import shutil
+import traceback
 import logging
 import logging.handlers
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, Callable
-from functools import wraps
+from typing import Dict, Any, Optional, Union, Callable, NamedTuple, Tuple
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import threading
-import traceback
-from dataclasses import dataclass, field
+import contextvars
+from collections import deque
+from dataclasses import dataclass, asdict, is_dataclass
 
 try:
     from rich.logging import RichHandler
@@ -55,14 +65,51 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Cached root threshold so disabled calls cost a single integer compare
+_MIN_LEVEL_NO = logging.INFO
+
+# Defaults resolved once at import instead of on every setup call
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_LOGS_FOLDER = 'logs'
+MAIN_LOG_FILENAME = 'canvas_downloader.log'
+ERROR_LOG_FILENAME = 'canvas_downloader_errors.log'
+
+# Innermost frames kept per exception in file logs
+TRACEBACK_LIMIT = 20
+
+# Size strings such as "50MB", "1.5 GB" or "512k"
+_SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$', re.IGNORECASE)
+_SIZE_MULTIPLIERS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
 
-@dataclass
-class LogContext:
+# Keys whose values are masked in structured log data
+SENSITIVE_KEY_PATTERNS = frozenset({'api_key', 'password', 'token', 'secret', 'credential'})
+_SENSITIVE_KEY_RE = re.compile('|'.join(map(re.escape, sorted(SENSITIVE_KEY_PATTERNS))),
+                               re.IGNORECASE)
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# (epoch second, rendered prefix) reused by _format_timestamp
+_TIMESTAMP_CACHE = (None, '')
+
+# Static process information, resolved once instead of per record
+_HOST = socket.gethostname()
+
+
+class LogContext(NamedTuple):
     """
     Context information for enhanced logging.
 
     This class maintains contextual information that should be included
-    in log messages for better traceability and debugging.
+    in log messages for better traceability and debugging. It is an
+    immutable value: updates create a new instance via ``_replace``.
     """
     # Course context
     course_id: Optional[str] = None
@@ -81,46 +128,171 @@ class LogContext:
     operation: Optional[str] = None
     step: Optional[str] = None
 
-    # Additional metadata
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Additional metadata as (key, value) pairs
+    metadata: Tuple[Tuple[str, Any], ...] = ()
+
+    # Named fields included in to_dict(), in tuple order (not a field)
+    _FIELDS = ('course_id', 'course_name', 'content_type', 'item_id', 'item_name',
+               'session_id', 'user_id', 'operation', 'step')
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert context to dictionary for logging."""
-        context = {}
-
-        if self.course_id:
-            context['course_id'] = self.course_id
-        if self.course_name:
-            context['course_name'] = self.course_name
-        if self.content_type:
-            context['content_type'] = self.content_type
-        if self.item_id:
-            context['item_id'] = self.item_id
-        if self.item_name:
-            context['item_name'] = self.item_name
-        if self.session_id:
-            context['session_id'] = self.session_id
-        if self.user_id:
-            context['user_id'] = self.user_id
-        if self.operation:
-            context['operation'] = self.operation
-        if self.step:
-            context['step'] = self.step
+        context = {name: value for name, value in zip(self._FIELDS, self) if value}
 
         # Add metadata
-        context.update(self.metadata)
+        if self.metadata:
+            context.update(self.metadata)
 
         return context
 
 
+# Initial per-logger context: no fields set, nothing rendered
+_EMPTY_CONTEXT = (LogContext(), {})
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class DownloadProgressRecord:
+    """
+    Immutable snapshot of a file download's progress.
+
+    Attached to a log record as a single ``download`` extra instead of a
+    handful of separate keyword fields, or collected in batches by a
+    ``ProgressRingBuffer``.
+    """
+    filename: str
+    bytes_downloaded: int
+    total_bytes: int
+    percentage: float
+    recorded_at: Optional[float] = None
+
+
+class ProgressRingBuffer:
+    """
+    In-memory ring buffer for download progress samples.
+
+    Progress updates can fire once per chunk for every concurrent download.
+    Instead of a log record each, samples are appended to a bounded deque
+    (the oldest are discarded when full) and a background thread emits them
+    every ``flush_interval`` seconds as one aggregated DEBUG record per
+    source logger and log context, captured when each sample was added.
+    """
+
+    def __init__(self, capacity: int = 4096, flush_interval: float = 1.0):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of samples held between flushes
+            flush_interval: Seconds between aggregated records
+        """
+        self.flush_interval = flush_interval
+        self._samples = deque(maxlen=capacity)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def append(self, logger: 'ContextualLogger', context: Tuple[LogContext, Dict[str, Any]],
+               sample: DownloadProgressRecord) -> None:
+        """
+        Add a sample; deque appends are thread-safe.
+
+        Args:
+            logger: Logger the sample was logged through
+            context: That logger's (context, rendered dict) at logging time
+            sample: Progress sample
+        """
+        self._samples.append((logger, context, sample))
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._flush_loop,
+                                        name='log-progress', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and emit any remaining samples."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Emit the buffered samples, one record per logger and context."""
+        # Context tuples are replaced, never mutated, so identity groups samples
+        groups = {}
+        pop = self._samples.popleft
+        try:
+            while True:
+                logger, context, sample = pop()
+                group = groups.get((logger, id(context)))
+                if group is None:
+                    group = groups[(logger, id(context))] = (context, [])
+                group[1].append(sample)
+        except IndexError:
+            pass
+
+        for (logger, _), (context, samples) in groups.items():
+            logger._log(
+                logging.DEBUG, "Download progress: %d samples", {},
+                args=(len(samples),), record_extra={'context': context[1], 'progress': samples}
+            )
+
+    def _flush_loop(self) -> None:
+        """Periodically emit buffered samples."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+def _mask_sensitive_data(data: Any) -> Any:
+    """
+    Mask sensitive data in log messages.
+
+    Kept as a plain module-level function over module globals so the hot
+    path avoids bound-method and attribute lookups; only dicts and strings
+    are visited recursively, other values are passed through as-is.
+
+    Args:
+        data: Data to mask
+
+    Returns:
+        Masked data
+    """
+    if isinstance(data, dict):
+        search = _SENSITIVE_KEY_RE.search
+        masked = {}
+        for key, value in data.items():
+            if isinstance(key, str) and search(key):
+                if isinstance(value, str) and len(value) > 8:
+                    masked[key] = f"{value[:4]}***{value[-4:]}"
+                else:
+                    masked[key] = "***"
+            elif isinstance(value, (dict, str)):
+                masked[key] = _mask_sensitive_data(value)
+            else:
+                masked[key] = value
+        return masked
+
+    # Long strings may be API keys or tokens
+    if isinstance(data, str) and len(data) > 20:
+        return f"{data[:4]}***{data[-4:]}"
+
+    return data
+
+
 class ContextualLogger:
     """
     Enhanced logger with contextual information and structured output.
 
     This logger extends the standard Python logging with additional features
     like context tracking, performance monitoring, and structured JSON output.
+
+    Context is stored in a ContextVar, so each thread and asyncio task sees
+    its own copy (tasks start from their parent's) and no lock is taken.
     """
 
+    __slots__ = ('name', 'base_logger', '_context_var', '_operation_timers')
+
     def __init__(self, name: str, base_logger: logging.Logger):
         """
         Initialize the contextual logger.
@@ -131,16 +303,18 @@ class ContextualLogger:
         """
         self.name = name
         self.base_logger = base_logger
-        self.context = LogContext()
-        self._lock = threading.RLock()
 
-        # Performance tracking
+        # (LogContext, rendered dict) for the current thread/task
+        self._context_var = contextvars.ContextVar(f'log_context:{name}',
+                                                   default=_EMPTY_CONTEXT)
+
+        # Performance tracking; single dict operations are atomic, no lock
         self._operation_timers = {}
 
-        # Sensitive data patterns for masking
-        self._sensitive_patterns = [
-            'api_key', 'password', 'token', 'secret', 'credential'
-        ]
+    @property
+    def context(self) -> LogContext:
+        """Context of the current thread or task (a snapshot; use set_context)."""
+        return self._context_var.get()[0]
 
     def set_context(self, **kwargs) -> None:
         """
@@ -149,120 +323,82 @@ class ContextualLogger:
         Args:
             **kwargs: Context key-value pairs
         """
-        with self._lock:
-            for key, value in kwargs.items():
-                if hasattr(self.context, key):
-                    setattr(self.context, key, value)
-                else:
-                    self.context.metadata[key] = value
+        current = self._context_var.get()[0]
+        named = {key: value for key, value in kwargs.items() if key in LogContext._FIELDS}
+        if len(named) < len(kwargs):
+            metadata = dict(current.metadata)
+            metadata.update((key, value) for key, value in kwargs.items() if key not in named)
+            named['metadata'] = tuple(metadata.items())
+
+        context = current._replace(**named)
+        self._context_var.set((context, context.to_dict()))
 
     def clear_context(self) -> None:
         """Clear all context information."""
-        with self._lock:
-            self.context = LogContext()
+        self._context_var.set(_EMPTY_CONTEXT)
 
-    def _mask_sensitive_data(self, data: Any) -> Any:
+    def isEnabledFor(self, level: int) -> bool:
         """
-        Mask sensitive data in log messages.
+        Check whether a message at this level would be logged.
 
-        Args:
-            data: Data to mask
-
-        Returns:
-            Masked data
-        """
-        if isinstance(data, dict):
-            masked = {}
-            for key, value in data.items():
-                if any(pattern in key.lower() for pattern in self._sensitive_patterns):
-                    if isinstance(value, str) and len(value) > 8:
-                        masked[key] = f"{value[:4]}***{value[-4:]}"
-                    else:
-                        masked[key] = "***"
-                else:
-                    masked[key] = self._mask_sensitive_data(value)
-            return masked
-        elif isinstance(data, str):
-            # Check if the string looks like an API key or token
-            if len(data) > 20 and any(char.isalnum() for char in data):
-                return f"{data[:4]}***{data[-4:]}"
-
-        return data
-
-    def _prepare_log_data(self, message: str, **kwargs) -> Dict[str, Any]:
-        """
-        Prepare structured log data.
+        Lets callers skip building expensive log arguments up front.
 
         Args:
-            message: Log message
-            **kwargs: Additional log data
+            level: Logging level
 
         Returns:
-            Structured log data
-        """
-        log_data = {
-            'timestamp': datetime.now().isoformat(),
-            'logger': self.name,
-            'message': message,
-            'thread_id': threading.get_ident(),
-            'process_id': os.getpid()
-        }
-
-        # Add context
-        context_data = self.context.to_dict()
-        if context_data:
-            log_data['context'] = context_data
-
-        # Add additional data
-        if kwargs:
-            # Mask sensitive data
-            safe_kwargs = self._mask_sensitive_data(kwargs)
-            log_data['data'] = safe_kwargs
-
-        return log_data
+            True if the underlying logger handles the level
+        """
+        return self.base_logger.isEnabledFor(level)
 
-    def _log(self, level: int, message: str, **kwargs) -> None:
+    def _log(self, level: int, message: str, kwargs: Dict[str, Any],
+             exception: Optional[BaseException] = None, args: tuple = (),
+             record_extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Internal logging method.
 
         Args:
             level: Logging level
-            message: Log message
-            **kwargs: Additional log data
+            message: Log message, optionally a %-style template
+            kwargs: Additional log data
+            exception: Optional exception; its traceback is rendered lazily
+                by the handlers that actually emit the record
+            args: Arguments for a %-style message, merged in only when a
+                handler renders the record
+            record_extra: Additional attributes to set on the log record
         """
         if not self.base_logger.isEnabledFor(level):
             return
 
-        # Prepare structured data
-        log_data = self._prepare_log_data(message, **kwargs)
-
-        # Create log message
+        # Context and masked data travel as record attributes; formatters
+        # render them (e.g. the console's "key=value" suffix) only on output
+        extra = {'context': self._context_var.get()[1]}
         if kwargs:
-            # Include additional data in message
-            extra_info = ', '.join(f"{k}={v}" for k, v in kwargs.items())
-            full_message = f"{message} ({extra_info})"
-        else:
-            full_message = message
+            extra['data'] = _mask_sensitive_data(kwargs)
+        if record_extra:
+            extra.update(record_extra)
 
-        # Add structured data as extra
-        extra = {
-            'structured_data': log_data,
-            'context': self.context.to_dict()
-        }
+        exc_info = (type(exception), exception, exception.__traceback__) if exception else None
 
-        self.base_logger.log(level, full_message, extra=extra)
+        self.base_logger.log(level, message, *args, exc_info=exc_info, extra=extra)
 
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message."""
-        self._log(logging.DEBUG, message, **kwargs)
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """Log debug message; ``args`` are %-merged into it only if emitted."""
+        if _MIN_LEVEL_NO > logging.DEBUG:
+            return
+        self._log(logging.DEBUG, message, kwargs, args=args)
 
-    def info(self, message: str, **kwargs) -> None:
-        """Log info message."""
-        self._log(logging.INFO, message, **kwargs)
+    def info(self, message: str, *args, **kwargs) -> None:
+        """Log info message; ``args`` are %-merged into it only if emitted."""
+        if _MIN_LEVEL_NO > logging.INFO:
+            return
+        self._log(logging.INFO, message, kwargs, args=args)
 
-    def warning(self, message: str, **kwargs) -> None:
-        """Log warning message."""
-        self._log(logging.WARNING, message, **kwargs)
+    def warning(self, message: str, *args, **kwargs) -> None:
+        """Log warning message; ``args`` are %-merged into it only if emitted."""
+        if _MIN_LEVEL_NO > logging.WARNING:
+            return
+        self._log(logging.WARNING, message, kwargs, args=args)
 
     def error(self, message: str, exception: Exception = None, **kwargs) -> None:
         """
@@ -273,12 +409,10 @@ class ContextualLogger:
             exception: Optional exception object
             **kwargs: Additional error data
         """
-        if exception:
-            kwargs['exception_type'] = type(exception).__name__
-            kwargs['exception_message'] = str(exception)
-            kwargs['traceback'] = traceback.format_exc()
+        if _MIN_LEVEL_NO > logging.ERROR:
+            return
 
-        self._log(logging.ERROR, message, **kwargs)
+        self._log(logging.ERROR, message, kwargs, exception)
 
     def critical(self, message: str, exception: Exception = None, **kwargs) -> None:
         """
@@ -289,12 +423,7 @@ class ContextualLogger:
             exception: Optional exception object
             **kwargs: Additional critical data
         """
-        if exception:
-            kwargs['exception_type'] = type(exception).__name__
-            kwargs['exception_message'] = str(exception)
-            kwargs['traceback'] = traceback.format_exc()
-
-        self._log(logging.CRITICAL, message, **kwargs)
+        self._log(logging.CRITICAL, message, kwargs, exception)
 
     def start_operation(self, operation_name: str, **kwargs) -> None:
         """
@@ -304,13 +433,13 @@ class ContextualLogger:
             operation_name: Name of the operation
             **kwargs: Additional operation data
         """
-        with self._lock:
-            self._operation_timers[operation_name] = {
-                'start_time': time.time(),
-                'metadata': kwargs
-            }
+        self._operation_timers[operation_name] = {
+            'start_ns': time.perf_counter_ns(),
+            'metadata': kwargs
+        }
 
-        self.info(f"Started operation: {operation_name}", **kwargs)
+        if _MIN_LEVEL_NO <= logging.INFO:
+            self.info("Started operation: %s", operation_name, **kwargs)
 
     def end_operation(self, operation_name: str, **kwargs) -> float:
         """
@@ -323,20 +452,20 @@ class ContextualLogger:
         Returns:
             Operation duration in seconds
         """
-        with self._lock:
-            if operation_name not in self._operation_timers:
-                self.warning(f"No timer found for operation: {operation_name}")
-                return 0.0
+        timer_data = self._operation_timers.pop(operation_name, None)
+        if timer_data is None:
+            self.warning("No timer found for operation: %s", operation_name)
+            return 0.0
 
-            timer_data = self._operation_timers.pop(operation_name)
-            duration = time.time() - timer_data['start_time']
+        duration = (time.perf_counter_ns() - timer_data['start_ns']) / 1_000_000_000
 
+        if _MIN_LEVEL_NO <= logging.INFO:
             # Combine metadata
             log_data = {**timer_data['metadata'], **kwargs, 'duration_seconds': duration}
 
-            self.info(f"Completed operation: {operation_name}", **log_data)
+            self.info("Completed operation: %s", operation_name, **log_data)
 
-            return duration
+        return duration
 
     def log_course_processing(self, course_name: str, course_id: str, status: str, **kwargs) -> None:
         """
@@ -348,7 +477,10 @@ class ContextualLogger:
             status: Processing status (start, progress, complete, error)
             **kwargs: Additional course data
         """
-        self.info(f"Course processing {status}",
+        if _MIN_LEVEL_NO > logging.INFO:
+            return
+
+        self.info("Course processing %s", status,
                  course_name=course_name,
                  course_id=course_id,
                  processing_status=status,
@@ -365,14 +497,186 @@ class ContextualLogger:
             total_bytes: Total file size
             **kwargs: Additional download data
         """
+        if _MIN_LEVEL_NO > logging.DEBUG:
+            return
+
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+
         percentage = (bytes_downloaded / total_bytes * 100) if total_bytes > 0 else 0
 
-        self.debug(f"Download progress: {filename}",
-                  filename=filename,
-                  bytes_downloaded=bytes_downloaded,
-                  total_bytes=total_bytes,
-                  percentage=percentage,
-                  **kwargs)
+        # Batched by the ring buffer when one is running; samples carry no
+        # extra data, so calls with kwargs still get a record of their own
+        buffer = _progress_buffer
+        if buffer is not None and not kwargs:
+            buffer.append(self, self._context_var.get(),
+                          DownloadProgressRecord(filename, bytes_downloaded, total_bytes,
+                                                 percentage, time.time()))
+            return
+
+        progress = DownloadProgressRecord(filename, bytes_downloaded, total_bytes, percentage)
+
+        self._log(logging.DEBUG, "Download progress: %s (%d/%d bytes, %.1f%%)", kwargs,
+                  args=(filename, bytes_downloaded, total_bytes, percentage),
+                  record_extra={'download': progress})
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """
+    Serialize a log payload to a JSON string.
+
+    Uses orjson when installed and falls back to the standard library for
+    payloads orjson rejects (e.g. integers wider than 64 bits). Datetimes
+    and dataclasses may be passed as-is; orjson renders them natively.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data, default=_json_default)
+
+
+def _format_timestamp(created: float) -> str:
+    """
+    Render an epoch timestamp as a local ISO-8601 string with microseconds.
+
+    The ``YYYY-MM-DDTHH:MM:SS`` prefix is rendered once per wall-clock second
+    and reused; only the fractional part is formatted per record.
+    """
+    global _TIMESTAMP_CACHE
+
+    seconds = int(created)
+    cached_seconds, prefix = _TIMESTAMP_CACHE
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _TIMESTAMP_CACHE = (seconds, prefix)
+    return f"{prefix}.{int((created - seconds) * 1_000_000):06d}"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects the json module does not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def _parse_size(value: Union[int, float, str], default_unit: str = 'M') -> int:
+    """
+    Parse a size setting into a byte count.
+
+    Bare numbers are interpreted in ``default_unit`` (megabytes by default,
+    matching the ``max_log_size_mb`` setting); strings may carry their own
+    unit, e.g. ``"50MB"`` or ``"1.5 GB"``.
+
+    Args:
+        value: Size as a number or string
+        default_unit: Unit applied to unitless values
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if isinstance(value, (int, float)):
+        return int(value * _SIZE_MULTIPLIERS[default_unit])
+
+    match = _SIZE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+
+    unit = match.group(2).upper()
+    if not unit and not value.strip()[-1:].isalpha():
+        unit = default_unit
+    return int(float(match.group(1)) * _SIZE_MULTIPLIERS[unit])
+
+
+@lru_cache(maxsize=None)
+def _make_logger(name: str) -> ContextualLogger:
+    """
+    Create the contextual logger for a name, once.
+
+    The cache is unbounded on purpose: evicting an entry would hand out a
+    second logger for the same name and split its context.
+    """
+    return ContextualLogger(name, logging.getLogger(name))
+
+
+# Record attributes set by ContextualLogger that JSONFormatter copies as-is
+_JSON_EXTRA_KEYS = ('data', 'context', 'download', 'progress')
+
+
+def _format_exception(ei) -> str:
+    """
+    Format an exception without reading source files.
+
+    Only the innermost ``TRACEBACK_LIMIT`` frames of each exception in the
+    chain are kept, and frames are rendered as file/line/function only, so
+    logging an error never goes through linecache. Used by both the console
+    and the JSON formatters.
+
+    Args:
+        ei: ``(type, value, traceback)`` tuple
+
+    Returns:
+        Formatted traceback string
+    """
+    exc_type, exc, tb = ei
+    te = traceback.TracebackException(exc_type, exc, tb, limit=-TRACEBACK_LIMIT,
+                                      lookup_lines=False)
+
+    pending, seen = [te], set()
+    while pending:
+        node = pending.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        node.stack = traceback.StackSummary.from_list(
+            [(frame.filename, frame.lineno, frame.name, '') for frame in node.stack]
+        )
+        pending.extend(n for n in (node.__cause__, node.__context__) if n is not None)
+
+    return ''.join(te.format()).rstrip('\n')
+
+
+class KeyValueFormatter(logging.Formatter):
+    """
+    Console formatter that appends a record's structured data to its message.
+
+    The ``(key=value, ...)`` suffix is built here, when the record is
+    actually rendered, instead of by every logging call.
+
+    The console handler runs on the calling thread, so tracebacks get the
+    same lookup-free, depth-limited rendering as the JSON log files.
+    """
+
+    def formatException(self, ei) -> str:
+        """Format an exception without reading source files (see _format_exception)."""
+        return _format_exception(ei)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """
+        Format the message part of a record, including its data.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            Formatted log line
+        """
+        data = record.__dict__.get('data')
+        if not data:
+            return super().formatMessage(record)
+
+        message = record.message
+        record.message = f"{message} ({', '.join(f'{k}={v}' for k, v in data.items())})"
+        try:
+            return super().formatMessage(record)
+        finally:
+            record.message = message
 
 
 class JSONFormatter(logging.Formatter):
@@ -381,8 +685,24 @@ class JSONFormatter(logging.Formatter):
 
     This formatter outputs log records as JSON for easy parsing
     and analysis by log aggregation systems.
+
+    The payload dict is a scratch object reused across records, so one
+    instance must only format from a single thread at a time (the file
+    handlers all run on the queue listener thread).
     """
 
+    def __init__(self, static_fields: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            static_fields: Fields that never change for the process (host,
+                app version, ...) and are bound once at handler-add time
+        """
+        super().__init__()
+        self.static_fields = dict(static_fields or {})
+        self._scratch = {}
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -393,35 +713,302 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-            'thread_id': record.thread,
-            'process_id': record.process
+        # Records at ERROR and above reach both the main and the error log;
+        # serialize them once and let the second sink reuse the line.
+        cached = record.__dict__.get('_json_line')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        log_data = self._scratch
+        log_data.clear()
+        log_data['timestamp'] = _format_timestamp(record.created)
+        log_data['level'] = record.levelname
+        log_data['logger'] = record.name
+        log_data['message'] = record.getMessage()
+        log_data['module'] = record.module
+        log_data['function'] = record.funcName
+        log_data['line'] = record.lineno
+        log_data['thread_id'] = record.thread
+        log_data['process_id'] = record.process
+        log_data.update(self.static_fields)
+
+        # Add optional extras (masked call data, context, download progress
+        # snapshot or batched samples) in a fixed order
+        attrs = record.__dict__
+        for key in _JSON_EXTRA_KEYS:
+            if key in attrs:
+                log_data[key] = attrs[key]
+
+        # Add exception info if present
+        if record.exc_info and record.exc_info[1] is not None:
+            log_data['exception'] = self._exception_fields(record.exc_info)
+
+        line = _json_dumps(log_data)
+        if record.levelno >= logging.ERROR:
+            record._json_line = (self, line)
+        return line
+
+    def formatException(self, ei) -> str:
+        """Format an exception without reading source files (see _format_exception)."""
+        return _format_exception(ei)
+
+    def _exception_fields(self, exc_info) -> Dict[str, str]:
+        """
+        Build the exception block for a record, once per exception.
+
+        The same exception is often logged several times while it propagates
+        (``error`` then ``critical``, or by stacked decorators). The rendered
+        fields are memoized on the exception itself and reused as long as its
+        traceback has not grown since. Exceptions do not support weak
+        references, so an attribute is used instead of a weak-keyed cache.
+
+        Args:
+            exc_info: ``(type, value, traceback)`` tuple from the record
+
+        Returns:
+            Dict with the exception type, message and formatted traceback
+        """
+        exc_type, exc, tb = exc_info
+        cached = getattr(exc, '_log_exception_fields', None)
+        if cached is not None and cached[0] is tb:
+            return cached[1]
+
+        fields = {
+            'type': exc_type.__name__,
+            'message': str(exc),
+            'traceback': self.formatException(exc_info)
         }
+        try:
+            exc._log_exception_fields = (tb, fields)
+        except AttributeError:
+            pass
+        return fields
 
-        # Add structured data if available
-        if hasattr(record, 'structured_data'):
-            log_data.update(record.structured_data)
 
-        # Add context if available
-        if hasattr(record, 'context'):
-            log_data['context'] = record.context
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that batches writes in a userspace buffer.
 
-        # Add exception info if present
-        if record.exc_info:
-            log_data['exception'] = {
-                'type': record.exc_info[0].__name__,
-                'message': str(record.exc_info[1]),
-                'traceback': self.formatException(record.exc_info)
-            }
+    Instead of flushing after every record, formatted records accumulate in
+    a write buffer that is written out when it fills up or when the owner
+    calls ``flush()`` (the ``FlushingQueueListener`` does so periodically).
+    Rollover is decided from a running size counter, so the stream is never
+    seeked and each record is formatted exactly once.
+
+    With ``compress_backups`` enabled, rotated files are gzipped on a
+    dedicated worker thread so rollover never waits on compression.
+    """
+
+    def __init__(self, filename: Union[str, Path], maxBytes: int = 0, backupCount: int = 0,
+                 encoding: Optional[str] = None, delay: bool = False,
+                 buffer_size: int = 32768, compress_backups: bool = False):
+        """
+        Initialize the buffered handler.
+
+        Args:
+            filename: Log file path
+            maxBytes: Rotate once the file would exceed this size (0 disables)
+            backupCount: Number of rotated files to keep
+            encoding: File encoding
+            delay: Defer opening the file until the first record
+            buffer_size: Size of the write buffer in bytes
+            compress_backups: Gzip rotated files in the background
+        """
+        self.buffer_size = buffer_size
+        self._stream_size = 0
+
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding, delay=delay)
+
+        self._pending_compression = None
+        if compress_backups:
+            self.namer = self._gz_namer
+            self.rotator = self._compressing_rotator
+
+    @staticmethod
+    def _gz_namer(name: str) -> str:
+        """Name rotated files with a .gz suffix."""
+        return name + '.gz'
+
+    def _compressing_rotator(self, source: str, dest: str) -> None:
+        """Move the active file aside and gzip it on the compression worker."""
+        staging = dest[:-len('.gz')]
+        os.replace(source, staging)
+        self._pending_compression = _compression_pool().submit(_gzip_file, staging, dest)
+
+    def doRollover(self) -> None:
+        """Rotate the log, waiting for a still-running compression first."""
+        # The previous backup is renamed during rollover, so it must be
+        # finished; this only blocks if rotations outpace compression.
+        pending = self._pending_compression
+        if pending is not None:
+            pending.result()
+            self._pending_compression = None
+        super().doRollover()
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=getattr(self, 'errors', None))
+        self._stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Append a record to the buffer, rotating first if needed."""
+        try:
+            msg = self.format(record) + self.terminator
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            if self.maxBytes > 0 and self._stream_size and \
+                    self._stream_size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(msg)
+            self._stream_size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that also flushes its buffered handlers.
+
+    Handlers are flushed from the listener thread itself, at most every
+    ``flush_interval`` seconds while records keep arriving and as soon as the
+    queue goes idle, so no separate flusher threads are needed.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler,
+                 respect_handler_level: bool = False, flush_interval: float = 1.0):
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: Queue to consume records from
+            *handlers: Handlers that process the records
+            respect_handler_level: Honour each handler's level
+            flush_interval: Maximum seconds between flushes
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Wait for the next record, flushing when idle or overdue."""
+        if self._unflushed:
+            try:
+                record = self.queue.get(block, self.flush_interval)
+            except queue.Empty:
+                self._flush_handlers()
+                record = self.queue.get(block)
+        else:
+            record = self.queue.get(block)
+
+        if self._unflushed and time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_handlers()
+        self._unflushed = True
+        return record
+
+    def _flush_handlers(self) -> None:
+        """Write out everything the handlers have buffered."""
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    """Compress a rotated log file and remove the original."""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+@lru_cache(maxsize=None)
+def _compression_pool() -> ThreadPoolExecutor:
+    """Single worker shared by all handlers that compress backups."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-compress')
+
+
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for a bounded queue that discards the oldest record when full.
+
+    Producers never block: when the listener falls behind, the oldest queued
+    record is dropped to make room. Once the queue has drained below half
+    capacity a single warning summarizing the number of dropped records is
+    enqueued.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
 
-        return json.dumps(log_data, default=str)
+        Args:
+            log_queue: Bounded queue consumed by a QueueListener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the listener thread.
+
+        Only the message is resolved here; exc_info is kept so tracebacks are
+        rendered by the file handlers on the listener thread.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping the oldest one if the queue is full."""
+        if self.dropped and self.queue.qsize() < self.queue.maxsize // 2:
+            self._enqueue_drop_summary()
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                with self._drop_lock:
+                    self.dropped += 1
+
+    def _enqueue_drop_summary(self) -> None:
+        """Report how many records were discarded while the queue was full."""
+        with self._drop_lock:
+            dropped, self.dropped = self.dropped, 0
+        if not dropped:
+            return
+
+        summary = logging.LogRecord(
+            name=__name__, level=logging.WARNING, pathname=__file__, lineno=0,
+            msg=f"Dropped {dropped} log records while the log queue was full",
+            args=None, exc_info=None
+        )
+        try:
+            self.queue.put_nowait(summary)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += dropped
 
 
 class CanvasDownloaderLoggerSetup:
@@ -440,8 +1027,11 @@ class CanvasDownloaderLoggerSetup:
             config: Logging configuration dictionary
         """
         self.config = config or {}
-        self.console = Console() if RICH_AVAILABLE else None
-        self._loggers = {}
+        self.console = None
+        self.logs_folder = Path(self.config.get('logs_folder', DEFAULT_LOGS_FOLDER))
+        self._queue_listener = None
+        self._queue_handler = None
+        self._progress_buffer = None
         self._setup_complete = False
 
     def setup_logging(self) -> None:
@@ -453,12 +1043,16 @@ class CanvasDownloaderLoggerSetup:
         log_level = self.config.get('level', 'INFO').upper()
         console_output = self.config.get('console_output', True)
         file_output = self.config.get('file_output', True)
-        log_format = self.config.get('format',
-                                   '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        log_format = self.config.get('format', DEFAULT_LOG_FORMAT)
 
         # Configure root logger
         root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, log_level))
+        set_level(log_level)
+
+        # Thread and process ids are captured by LogRecord itself; skip its
+        # per-record multiprocessing lookup unless the format shows it
+        if '%(processName)' not in log_format:
+            logging.logMultiprocessing = False
 
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
@@ -466,7 +1060,8 @@ class CanvasDownloaderLoggerSetup:
 
         # Set up console handler
         if console_output:
-            self._setup_console_handler(root_logger, log_format)
+            self._setup_console_handler(root_logger, log_format,
+                                        self.config.get('console_level') or log_level)
 
         # Set up file handler
         if file_output:
@@ -475,73 +1070,154 @@ class CanvasDownloaderLoggerSetup:
         # Configure third-party loggers
         self._configure_third_party_loggers()
 
+        # Batch download progress samples instead of one record per chunk
+        self._start_progress_buffer()
+
         self._setup_complete = True
+        atexit.register(self.shutdown)
 
-    def _setup_console_handler(self, logger: logging.Logger, log_format: str) -> None:
-        """Set up console logging handler."""
+    def _start_progress_buffer(self) -> None:
+        """Start the download progress ring buffer and publish it."""
+        global _progress_buffer
+
+        self._progress_buffer = ProgressRingBuffer(
+            capacity=self.config.get('progress_buffer_size', 4096),
+            flush_interval=self.config.get('progress_flush_interval', 1.0)
+        )
+        self._progress_buffer.start()
+        _progress_buffer = self._progress_buffer
+
+    def _setup_console_handler(self, logger: logging.Logger, log_format: str,
+                               console_level: str) -> None:
+        """
+        Set up console logging handler.
+
+        Rich tracebacks (source extraction and highlighting on the logging
+        thread) are opt-in via ``rich_tracebacks``; ``console_level`` lets the
+        console show less than the log files capture.
+        """
         if RICH_AVAILABLE and self.config.get('use_rich_console', True):
             # Use Rich handler for enhanced console output
+            if self.console is None:
+                self.console = Console()
             console_handler = RichHandler(
                 console=self.console,
                 show_time=True,
                 show_path=False,
-                rich_tracebacks=True,
+                rich_tracebacks=self.config.get('rich_tracebacks', False),
                 tracebacks_show_locals=False
             )
+            console_handler.setFormatter(KeyValueFormatter())
         else:
             # Use standard console handler
             console_handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(log_format)
+            formatter = KeyValueFormatter(log_format)
             console_handler.setFormatter(formatter)
 
+        console_handler.setLevel(console_level.upper())
         logger.addHandler(console_handler)
 
     def _setup_file_handler(self, logger: logging.Logger) -> None:
-        """Set up file logging with rotation."""
+        """Set up buffered file logging with rotation."""
         # Get log file configuration
-        logs_folder = Path(self.config.get('logs_folder', 'logs'))
+        logs_folder = self.logs_folder
         logs_folder.mkdir(parents=True, exist_ok=True)
 
-        max_size_mb = self.config.get('max_log_size_mb', 50)
+        max_bytes = _parse_size(self.config.get('max_log_size',
+                                                self.config.get('max_log_size_mb', 50)))
         backup_count = self.config.get('backup_count', 5)
+        buffer_size = self.config.get('buffer_size', 32768)
+        flush_interval = self.config.get('flush_interval', 1.0)
+        compress_backups = self.config.get('compress_backups', False)
 
         # Main log file with rotation
-        log_file = logs_folder / 'canvas_downloader.log'
-        file_handler = logging.handlers.RotatingFileHandler(
+        log_file = logs_folder / MAIN_LOG_FILENAME
+        file_handler = BufferedRotatingFileHandler(
             log_file,
-            maxBytes=max_size_mb * 1024 * 1024,
+            maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True,
+            buffer_size=buffer_size,
+            compress_backups=compress_backups
         )
 
-        # Use JSON formatter for file output
-        json_formatter = JSONFormatter()
-        file_handler.setFormatter(json_formatter)
+        # Files are opened on the first record they receive, so a run without
+        # errors never creates the error log
 
-        logger.addHandler(file_handler)
+        # Use JSON formatter for file output, binding static process fields once
+        json_formatter = JSONFormatter(static_fields={'host': _HOST})
+        file_handler.setFormatter(json_formatter)
 
         # Separate error log file
-        error_log_file = logs_folder / 'canvas_downloader_errors.log'
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_log_file = logs_folder / ERROR_LOG_FILENAME
+        error_handler = BufferedRotatingFileHandler(
             error_log_file,
-            maxBytes=max_size_mb * 1024 * 1024,
+            maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True,
+            buffer_size=buffer_size,
+            compress_backups=compress_backups
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(json_formatter)
 
-        logger.addHandler(error_handler)
+        # File handlers run on a listener thread fed by a bounded queue so
+        # slow disks cannot stall callers or grow memory without limit
+        log_queue = queue.Queue(maxsize=self.config.get('queue_size', 10000))
+        self._queue_listener = FlushingQueueListener(
+            log_queue, file_handler, error_handler,
+            respect_handler_level=True, flush_interval=flush_interval
+        )
+        self._queue_listener.start()
+
+        self._queue_handler = DropOldestQueueHandler(log_queue)
+        logger.addHandler(self._queue_handler)
+
+    def shutdown(self) -> None:
+        """
+        Flush buffered progress, drain the log queue and close the file handlers.
+
+        Safe to call more than once; it also runs automatically at exit.
+        A later setup_logging() call builds a fresh pipeline.
+        """
+        global _progress_buffer
+
+        if not self._setup_complete:
+            return
+        atexit.unregister(self.shutdown)
+        self._setup_complete = False
+
+        if self._progress_buffer is not None:
+            if _progress_buffer is self._progress_buffer:
+                _progress_buffer = None
+            self._progress_buffer.stop()
+            self._progress_buffer = None
+
+        listener = self._queue_listener
+        if listener is None:
+            return
+        self._queue_listener = None
+
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._queue_handler = None
+
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
     def _configure_third_party_loggers(self) -> None:
         """Configure logging levels for third-party libraries."""
-        # Reduce noise from third-party libraries
+        # Reduce noise from third-party libraries; below these levels
+        # isEnabledFor() rejects records before any LogRecord is built.
+        # canvasapi logs every API call at INFO, so that is opt-in.
         third_party_loggers = {
             'urllib3': logging.WARNING,
             'requests': logging.WARNING,
             'aiohttp': logging.WARNING,
             'asyncio': logging.WARNING,
-            'canvasapi': logging.INFO
+            'canvasapi': logging.INFO if self.config.get('verbose_api', False) else logging.WARNING
         }
 
         for logger_name, level in third_party_loggers.items():
@@ -560,15 +1236,14 @@ class CanvasDownloaderLoggerSetup:
         if not self._setup_complete:
             self.setup_logging()
 
-        if name not in self._loggers:
-            base_logger = logging.getLogger(name)
-            self._loggers[name] = ContextualLogger(name, base_logger)
-
-        return self._loggers[name]
+        return _make_logger(name)
 
 
 # Global logger setup instance
 _logger_setup = None
+
+# Download progress buffer of the active setup, if any
+_progress_buffer = None
 _setup_lock = threading.Lock()
 
 
@@ -587,6 +1262,34 @@ def setup_logging(config: Dict[str, Any] = None) -> None:
         _logger_setup.setup_logging()
 
 
+def shutdown_logging() -> None:
+    """
+    Flush and stop the background file logging, if it was started.
+
+    Call this before reading log files or forking worker processes; it is
+    also registered to run at interpreter exit.
+    """
+    with _setup_lock:
+        if _logger_setup is not None:
+            _logger_setup.shutdown()
+
+
+def set_level(level: Union[int, str]) -> None:
+    """
+    Change the root logging level and refresh the cached threshold.
+
+    Args:
+        level: Level name (e.g. 'DEBUG') or numeric level
+    """
+    global _MIN_LEVEL_NO
+
+    if isinstance(level, str):
+        level = getattr(logging, level.upper())
+
+    logging.getLogger().setLevel(level)
+    _MIN_LEVEL_NO = level
+
+
 def get_logger(name: str) -> ContextualLogger:
     """
     Get a logger instance for the specified name.
@@ -599,6 +1302,11 @@ def get_logger(name: str) -> ContextualLogger:
     """
     global _logger_setup
 
+    # Fast path once logging is configured: one cached lookup, no lock
+    setup = _logger_setup
+    if setup is not None and setup._setup_complete:
+        return _make_logger(name)
+
     with _setup_lock:
         if _logger_setup is None:
             # Initialize with default config if not already set up
@@ -607,46 +1315,77 @@ def get_logger(name: str) -> ContextualLogger:
         return _logger_setup.get_logger(name)
 
 
-def log_execution_time(func: Callable) -> Callable:
+def _log_operation_end(logger: ContextualLogger, operation_name: str,
+                       start_ns: int, **kwargs) -> None:
+    """Log the completion of a timed call started at ``start_ns``."""
+    duration = (time.perf_counter_ns() - start_ns) / 1_000_000_000
+    logger.info("Completed operation: %s", operation_name, **kwargs, duration_seconds=duration)
+
+
+def log_execution_time(func: Union[Callable, str, None] = None, *,
+                       operation: Optional[str] = None) -> Callable:
     """
     Decorator to log function execution time.
 
+    Can be applied bare (``@log_execution_time``) or with an explicit
+    operation name (``@log_execution_time("CoursesAPI.list")``). The
+    operation name is resolved once, at decoration time.
+
     Args:
-        func: Function to decorate
+        func: Function to decorate, or an operation name
+        operation: Optional operation name (defaults to module.qualname)
 
     Returns:
         Decorated function
     """
+    if isinstance(func, str):
+        func, operation = None, func
+    if func is None:
+        return lambda f: log_execution_time(f, operation=operation)
+
+    operation_name = operation or f"{func.__module__}.{func.__qualname__}"
+    logger = None
+
+    def bind_logger() -> ContextualLogger:
+        # Bound on first call rather than at decoration time, so importing
+        # a decorated module does not set up logging
+        nonlocal logger
+        logger = get_logger(func.__module__)
+        return logger
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        operation_name = f"{func.__module__}.{func.__name__}"
+        if _MIN_LEVEL_NO > logging.INFO:
+            return func(*args, **kwargs)
 
-        logger.start_operation(operation_name)
+        log = logger or bind_logger()
+        log.info("Started operation: %s", operation_name)
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            logger.end_operation(operation_name, success=True)
-            return result
         except Exception as e:
-            logger.end_operation(operation_name, success=False, error=str(e))
+            _log_operation_end(log, operation_name, start_ns, success=False, error=str(e))
             raise
+        _log_operation_end(log, operation_name, start_ns, success=True)
+        return result
 
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        operation_name = f"{func.__module__}.{func.__name__}"
+        if _MIN_LEVEL_NO > logging.INFO:
+            return await func(*args, **kwargs)
 
-        logger.start_operation(operation_name)
+        log = logger or bind_logger()
+        log.info("Started operation: %s", operation_name)
+        start_ns = time.perf_counter_ns()
         try:
             result = await func(*args, **kwargs)
-            logger.end_operation(operation_name, success=True)
-            return result
         except Exception as e:
-            logger.end_operation(operation_name, success=False, error=str(e))
+            _log_operation_end(log, operation_name, start_ns, success=False, error=str(e))
             raise
+        _log_operation_end(log, operation_name, start_ns, success=True)
+        return result
 
     # Return appropriate wrapper based on function type
-    import asyncio
     if asyncio.iscoroutinefunction(func):
         return async_wrapper
     else:
@@ -43,11 +43,14 @@ Usage:
     tracker.complete_content_type("assignments")
 """
 
+import json
+import queue
 import threading
 import time
 import sys
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any, Union
+from typing import Dict, List, Optional, Callable, Any, Union, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -68,8 +71,39 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..utils.logger import get_logger
 
+# Upper bound on how often coalesced updates are pushed to Rich and callbacks
+DISPLAY_REFRESH_PER_SECOND = 2
+
+# High-frequency callback events; only the latest call per refresh is delivered
+COALESCED_CALLBACK_EVENTS = frozenset({'item_updated', 'download_progress'})
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Initial values of ProgressTracker.stats
+_INITIAL_STATS = {
+    'courses_processed': 0,
+    'content_types_processed': 0,
+    'items_processed': 0,
+    'total_bytes_downloaded': 0,
+    'errors_encountered': 0,
+    'warnings_encountered': 0
+}
+
+# Stats bumped from download workers; kept in _AtomicCounters rather than
+# under the tracker lock and merged into the stats snapshot on read
+_ATOMIC_STATS = ('total_bytes_downloaded', 'errors_encountered', 'warnings_encountered')
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class ProgressLevel(Enum):
     """Enumeration of different progress tracking levels."""
@@ -80,7 +114,7 @@ class ProgressLevel(Enum):
     DOWNLOAD = "download"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProgressState:
     """
     Data class representing the state of a progress operation.
@@ -96,12 +130,11 @@ class ProgressState:
     # Progress tracking
     current: int = 0
     total: int = 0
-    percentage: float = 0.0
 
     # Status information
     status: str = "pending"  # pending, active, completed, error
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: Optional[float] = None  # time.monotonic() seconds
+    end_time: Optional[float] = None  # time.monotonic() seconds
     duration: Optional[timedelta] = None
 
     # Error handling
@@ -118,18 +151,25 @@ class ProgressState:
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Guards counter updates on this state only, so item updates for
+    # different content types do not serialise on the tracker lock
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False,
+                                  repr=False, compare=False)
+
+    @property
+    def percentage(self) -> float:
+        """Completion percentage, derived from current and total on read."""
+        if self.total > 0:
+            return (self.current / self.total) * 100
+        return 0.0
+
     def update_progress(self, current: int = None, total: int = None) -> None:
-        """Update progress values and calculate percentage."""
+        """Update progress values."""
         if current is not None:
             self.current = current
         if total is not None:
             self.total = total
 
-        if self.total > 0:
-            self.percentage = (self.current / self.total) * 100
-        else:
-            self.percentage = 0.0
-
     def add_bytes(self, bytes_count: int) -> None:
         """Add to the bytes downloaded counter."""
         self.bytes_downloaded += bytes_count
@@ -138,25 +178,83 @@ class ProgressState:
         """Add a warning message."""
         self.warnings.append(warning)
 
+    def elapsed_seconds(self, now: Optional[float] = None) -> float:
+        """
+        Seconds spent on the operation so far (or in total once finished).
+
+        Args:
+            now: Current time.monotonic() value, so callers formatting
+                several states can read the clock once
+
+        Returns:
+            float: Elapsed seconds, 0.0 if the operation has not started
+        """
+        if self.start_time is None:
+            return 0.0
+        if self.end_time is not None:
+            return self.end_time - self.start_time
+        if now is None:
+            now = time.monotonic()
+        return now - self.start_time
+
     def mark_started(self) -> None:
         """Mark the operation as started."""
         self.status = "active"
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
 
     def mark_completed(self) -> None:
         """Mark the operation as completed."""
         self.status = "completed"
-        self.end_time = datetime.now()
-        if self.start_time:
-            self.duration = self.end_time - self.start_time
+        self._mark_ended()
 
     def mark_error(self, error_message: str) -> None:
         """Mark the operation as failed with an error."""
         self.status = "error"
         self.error_message = error_message
-        self.end_time = datetime.now()
-        if self.start_time:
-            self.duration = self.end_time - self.start_time
+        self._mark_ended()
+
+    def _mark_ended(self) -> None:
+        """Stamp the end time and derive the duration."""
+        self.end_time = time.monotonic()
+        if self.start_time is not None:
+            self.duration = timedelta(seconds=self.end_time - self.start_time)
+
+
+def _callback_ref(callback: Callable) -> Union[Callable, "weakref.WeakMethod"]:
+    """
+    Wrap a bound method in a WeakMethod so a registered handler does not
+    keep its object (e.g. a closed GUI window) alive; other callables are
+    kept as-is, since a lambda passed inline would otherwise die at once.
+    """
+    if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+        return weakref.WeakMethod(callback)
+    return callback
+
+
+class _AtomicCounter:
+    """
+    Integer counter guarded by its own lock.
+
+    Used for counters that are bumped from many download workers and have
+    no invariant with the rest of the tracker state, so hot updates never
+    contend on the tracker-wide lock.
+    """
+
+    __slots__ = ('_value', '_lock')
+
+    def __init__(self, value: int = 0):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def add(self, amount: int = 1) -> None:
+        """Add to the counter."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        """Current counter value."""
+        return self._value
 
 
 class ProgressTracker:
@@ -207,6 +305,23 @@ class ProgressTracker:
         self.current_content_type: Optional[str] = None
         self.current_item_id: Optional[str] = None
 
+        # State of the current course's active content type, kept so the
+        # per-item paths skip building its key and looking it up
+        self._current_content_state: Optional[ProgressState] = None
+
+        # Hot-path updates (the Rich item task and high-frequency callbacks)
+        # only record their latest values; one background thread, started
+        # on first use, applies them at a bounded rate. It is also the only
+        # thread that updates Rich tasks: other updates are queued for it.
+        self._task_updates: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._pending_item_update = None
+        self._rendered_item_update = None
+        self._pending_callbacks: Dict[str, tuple] = {}
+        self._display_lock = threading.Lock()
+        self._display_dirty = threading.Event()
+        self._display_stop = threading.Event()
+        self._display_thread: Optional[threading.Thread] = None
+
         # Rich console setup
         if self.use_rich:
             self.console = Console()
@@ -214,25 +329,24 @@ class ProgressTracker:
         else:
             self.console = None
 
-        # Statistics
-        self.stats = {
-            'courses_processed': 0,
-            'content_types_processed': 0,
-            'items_processed': 0,
-            'total_bytes_downloaded': 0,
-            'errors_encountered': 0,
-            'warnings_encountered': 0
-        }
-
-        # Callbacks for custom integration
-        self.callbacks: Dict[str, List[Callable]] = {
-            'course_started': [],
-            'course_completed': [],
-            'content_type_started': [],
-            'content_type_completed': [],
-            'item_updated': [],
-            'download_progress': [],
-            'error_occurred': []
+        # Statistics; the _ATOMIC_STATS counters are kept separately so their
+        # updates skip the tracker lock, and _stats only holds their key order
+        # (read both merged through stats or get_overall_statistics)
+        self._counters = {name: _AtomicCounter() for name in _ATOMIC_STATS}
+        self._stats = dict(_INITIAL_STATS)
+
+        # Callbacks for custom integration. Each event maps to a tuple that is
+        # replaced (never mutated) under _callbacks_lock, so dispatch iterates
+        # it without locking and callbacks may re-register themselves.
+        self._callbacks_lock = threading.Lock()
+        self.callbacks: Dict[str, Tuple[Callable, ...]] = {
+            'course_started': (),
+            'course_completed': (),
+            'content_type_started': (),
+            'content_type_completed': (),
+            'item_updated': (),
+            'download_progress': (),
+            'error_occurred': ()
         }
 
         self.logger.info("Progress tracker initialized",
@@ -263,6 +377,79 @@ class ProgressTracker:
         self.content_task = None
         self.item_task = None
 
+    def _mark_display_dirty(self) -> None:
+        """Wake the display thread, starting it on first use."""
+        if self._display_thread is None:
+            with self._display_lock:
+                if self._display_thread is None:
+                    self._display_thread = threading.Thread(
+                        target=self._display_loop, name='progress-display', daemon=True
+                    )
+                    self._display_thread.start()
+        self._display_dirty.set()
+
+    def _display_loop(self) -> None:
+        """Apply coalesced updates until cleanup() is called."""
+        interval = 1.0 / DISPLAY_REFRESH_PER_SECOND
+        while not self._display_stop.is_set():
+            self._display_dirty.wait()
+            self._display_dirty.clear()
+            self._flush_display()
+            self._display_stop.wait(interval)
+
+    def _update_task(self, task_id, **fields) -> None:
+        """Hand a Rich task update to the display thread."""
+        self._task_updates.put(('update', task_id, fields))
+        self._mark_display_dirty()
+
+    def _reset_task(self, task_id, **fields) -> None:
+        """Hand a Rich task reset (progress and timer) to the display thread."""
+        self._task_updates.put(('reset', task_id, fields))
+        self._mark_display_dirty()
+
+    def _flush_display(self) -> None:
+        """Apply queued and pending Rich task updates and deliver pending callbacks."""
+        with self._display_lock:
+            while True:
+                try:
+                    method, task_id, fields = self._task_updates.get_nowait()
+                except queue.Empty:
+                    break
+                getattr(self.progress, method)(task_id, **fields)
+
+            pending = self._pending_item_update
+            # Each update is a fresh tuple, so identity tells whether anything
+            # changed since the last push (e.g. a wake-up for callbacks only)
+            rendered = self._rendered_item_update
+            if pending is not None and pending is not rendered:
+                task_id, completed, content_type, item_name = pending
+                # The description only changes with the task or item name
+                if rendered is not None and rendered[0] == task_id and rendered[2:] == pending[2:]:
+                    self.progress.update(task_id, completed=completed)
+                else:
+                    description = content_type.title()
+                    if item_name:
+                        description += f": {item_name}"
+                    self.progress.update(task_id, completed=completed,
+                                         description=description)
+                self._rendered_item_update = pending
+        self._flush_callbacks()
+
+    def _flush_callbacks(self) -> None:
+        """Deliver the latest pending call of each coalesced callback event."""
+        with self._display_lock:
+            if not self._pending_callbacks:
+                return
+            pending, self._pending_callbacks = self._pending_callbacks, {}
+        for event, (args, kwargs) in pending.items():
+            self._invoke_callbacks(event, args, kwargs)
+
+    def _discard_pending_display(self) -> None:
+        """Drop a pending item update that a direct task update supersedes."""
+        with self._display_lock:
+            self._pending_item_update = None
+            self._rendered_item_update = None
+
     def register_callback(self, event: str, callback: Callable) -> None:
         """
         Register a callback function for specific events.
@@ -272,9 +459,10 @@ class ProgressTracker:
             callback: Function to call when event occurs
         """
         if event in self.callbacks:
-            self.callbacks[event].append(callback)
+            with self._callbacks_lock:
+                self.callbacks[event] += (_callback_ref(callback),)
         else:
-            self.logger.warning(f"Unknown callback event: {event}")
+            self.logger.warning("Unknown callback event: %s", event)
 
     def add_progress_callback(self, callback: Callable) -> None:
         """
@@ -287,11 +475,14 @@ class ProgressTracker:
             callback: Function to call with progress updates
         """
         if callback:
+            ref = _callback_ref(callback)
+
             # Register the callback for multiple relevant events
-            for event in ['course_started', 'course_completed', 'item_updated', 'progress_updated']:
-                if event in self.callbacks:
-                    if callback not in self.callbacks[event]:
-                        self.callbacks[event].append(callback)
+            with self._callbacks_lock:
+                for event in ['course_started', 'course_completed', 'item_updated', 'progress_updated']:
+                    if event in self.callbacks:
+                        if ref not in self.callbacks[event]:
+                            self.callbacks[event] += (ref,)
 
             self.logger.debug("Added progress callback for orchestrator")
 
@@ -306,20 +497,54 @@ class ProgressTracker:
             callback: Function to remove from callbacks
         """
         if callback:
+            ref = _callback_ref(callback)
+
             # Remove the callback from all events
-            for event_callbacks in self.callbacks.values():
-                if callback in event_callbacks:
-                    event_callbacks.remove(callback)
+            with self._callbacks_lock:
+                for event, event_callbacks in self.callbacks.items():
+                    if ref in event_callbacks:
+                        self.callbacks[event] = tuple(
+                            entry for entry in event_callbacks if entry != ref
+                        )
 
             self.logger.debug("Removed progress callback for orchestrator")
 
     def _trigger_callbacks(self, event: str, *args, **kwargs) -> None:
-        """Trigger all callbacks for a specific event."""
-        for callback in self.callbacks.get(event, []):
+        """
+        Trigger all callbacks for a specific event.
+
+        Events in COALESCED_CALLBACK_EVENTS are delivered by the display
+        thread with only their latest arguments. Any pending coalesced calls
+        are delivered before other events so callbacks still see them in order.
+        """
+        if not self.callbacks.get(event):
+            return
+        if event in COALESCED_CALLBACK_EVENTS:
+            with self._display_lock:
+                self._pending_callbacks[event] = (args, kwargs)
+            self._mark_display_dirty()
+            return
+        self._flush_callbacks()
+        self._invoke_callbacks(event, args, kwargs)
+
+    def _invoke_callbacks(self, event: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Call every callback registered for an event, pruning dead weak refs."""
+        dead = []
+        for entry in self.callbacks.get(event, ()):
+            callback = entry() if isinstance(entry, weakref.WeakMethod) else entry
+            if callback is None:
+                dead.append(entry)
+                continue
             try:
                 callback(*args, **kwargs)
             except Exception as e:
-                self.logger.warning(f"Callback failed for event {event}", exception=e)
+                self.logger.warning("Callback failed for event %s", event, exception=e)
+
+        if dead:
+            with self._callbacks_lock:
+                self.callbacks[event] = tuple(
+                    entry for entry in self.callbacks[event] if entry not in dead
+                )
 
     def set_total_courses(self, total: int) -> None:
         """
@@ -337,21 +562,25 @@ class ProgressTracker:
                     f"Processing {total} courses", total=total
                 )
 
-            self.logger.info(f"Set total courses to {total}")
+        self.logger.info("Set total courses to %d", total)
 
-    def start_course(self, course_name: str, course_id: str = None) -> None:
+    def start_course(self, course_name: str, course_id: str = None,
+                     total_content_types: int = None) -> None:
         """
         Start processing a new course.
 
         Args:
             course_name: Name of the course
             course_id: Optional course ID
+            total_content_types: Optional number of content types to process;
+                saves a separate set_total_content_types() call
         """
         with self._lock:
             if course_id is None:
                 course_id = course_name
 
             self.current_course_id = course_id
+            self._current_content_state = None
 
             # Create course state
             course_state = ProgressState(
@@ -361,19 +590,29 @@ class ProgressTracker:
             )
             course_state.mark_started()
             course_state.metadata['course_id'] = course_id
+            if total_content_types is not None:
+                course_state.update_progress(total=total_content_types)
 
             self.course_states[course_id] = course_state
 
+            # One Rich task is reused for every course rather than
+            # leaving a finished task behind per course
             if self.use_rich and self.progress:
-                self.course_task = self.progress.add_task(
-                    f"Course: {course_name}", total=100
-                )
-
-            self._trigger_callbacks('course_started', course_name, course_id)
-
-            self.logger.info(f"Started processing course",
-                           course_name=course_name,
-                           course_id=course_id)
+                if self.course_task is None:
+                    self.course_task = self.progress.add_task(
+                        f"Course: {course_name}", total=100
+                    )
+                else:
+                    self._reset_task(self.course_task, total=100,
+                                     description=f"Course: {course_name}")
+
+        # Callbacks run after the lock is released so slow handlers
+        # never stall other threads updating progress
+        self._trigger_callbacks('course_started', course_name, course_id)
+
+        self.logger.info("Started processing course",
+                       course_name=course_name,
+                       course_id=course_id)
 
     def set_total_content_types(self, total: int) -> None:
         """
@@ -382,6 +621,10 @@ class ProgressTracker:
         Args:
             total: Number of content types to process
         """
+        # Nothing to update outside a course; skip the lock entirely
+        if not self.current_course_id:
+            return
+
         with self._lock:
             if self.current_course_id:
                 course_state = self.course_states.get(self.current_course_id)
@@ -410,17 +653,23 @@ class ProgressTracker:
 
             state_key = f"{self.current_course_id}:{content_type}"
             self.content_type_states[state_key] = content_state
+            self._current_content_state = content_state
 
             if self.use_rich and self.progress:
-                self.content_task = self.progress.add_task(
-                    f"{content_type.title()}", total=total_items
-                )
+                if self.content_task is None:
+                    self.content_task = self.progress.add_task(
+                        f"{content_type.title()}", total=total_items
+                    )
+                else:
+                    self._discard_pending_display()
+                    self._reset_task(self.content_task, total=total_items,
+                                     description=content_type.title())
 
-            self._trigger_callbacks('content_type_started', content_type, total_items)
+        self._trigger_callbacks('content_type_started', content_type, total_items)
 
-            self.logger.info(f"Started processing content type",
-                           content_type=content_type,
-                           total_items=total_items)
+        self.logger.info("Started processing content type",
+                       content_type=content_type,
+                       total_items=total_items)
 
     def set_total_items(self, total: int) -> None:
         """
@@ -429,43 +678,38 @@ class ProgressTracker:
         Args:
             total: Total number of items
         """
-        with self._lock:
-            if self.current_content_type and self.current_course_id:
-                state_key = f"{self.current_course_id}:{self.current_content_type}"
-                content_state = self.content_type_states.get(state_key)
-                if content_state:
-                    content_state.update_progress(total=total)
+        content_state = self._current_content_state
+        if content_state:
+            with content_state._lock:
+                content_state.update_progress(total=total)
 
-                    if self.use_rich and self.content_task:
-                        self.progress.update(self.content_task, total=total)
+            if self.use_rich and self.content_task:
+                self._update_task(self.content_task, total=total)
 
     def update_item_progress(self, current: int, item_name: str = None) -> None:
         """
         Update progress for the current content type.
 
+        Only the content type's own lock is taken, so workers updating
+        different content types never contend with each other.
+
         Args:
             current: Current item number being processed
             item_name: Optional name of the current item
         """
-        with self._lock:
-            if self.current_content_type and self.current_course_id:
-                state_key = f"{self.current_course_id}:{self.current_content_type}"
-                content_state = self.content_type_states.get(state_key)
-                if content_state:
-                    content_state.update_progress(current=current)
-                    content_state.items_processed = current
+        content_state = self._current_content_state
+        if content_state:
+            # Inlined update_progress(current=...); this runs once per item
+            with content_state._lock:
+                content_state.current = current
+                content_state.items_processed = current
 
-                    if self.use_rich and self.content_task:
-                        description = f"{self.current_content_type.title()}"
-                        if item_name:
-                            description += f": {item_name}"
-                        self.progress.update(
-                            self.content_task,
-                            completed=current,
-                            description=description
-                        )
+            if self.use_rich and self.content_task:
+                self._pending_item_update = (self.content_task, current,
+                                             content_state.name, item_name)
+                self._mark_display_dirty()
 
-                    self._trigger_callbacks('item_updated', current, item_name)
+            self._trigger_callbacks('item_updated', current, item_name)
 
     def update_download_progress(self, percentage: float,
                                bytes_downloaded: int = 0,
@@ -480,16 +724,29 @@ class ProgressTracker:
             total_bytes: Total file size in bytes
             filename: Name of file being downloaded
         """
-        with self._lock:
-            # Update global statistics
-            self.stats['total_bytes_downloaded'] += bytes_downloaded
+        # Update global statistics
+        self._counters['total_bytes_downloaded'].add(bytes_downloaded)
+
+        # Trigger callbacks
+        self._trigger_callbacks('download_progress',
+                                percentage, bytes_downloaded, total_bytes, filename)
 
-            # Trigger callbacks
-            self._trigger_callbacks('download_progress',
-                                  percentage, bytes_downloaded, total_bytes, filename)
+        # Rich display updates are handled by individual downloaders
+        # to avoid conflicts with multiple simultaneous downloads
 
-            # Rich display updates are handled by individual downloaders
-            # to avoid conflicts with multiple simultaneous downloads
+    def add_downloaded_bytes(self, bytes_count: int) -> None:
+        """
+        Add to the downloaded byte total without per-chunk bookkeeping.
+
+        Meant for downloaders that sum chunk sizes locally and report them
+        in batches (e.g. once per file); unlike update_download_progress it
+        fires no callbacks.
+
+        Args:
+            bytes_count: Number of bytes downloaded since the last report
+        """
+        if bytes_count:
+            self._counters['total_bytes_downloaded'].add(bytes_count)
 
     def complete_content_type(self, content_type: str) -> None:
         """
@@ -504,11 +761,14 @@ class ProgressTracker:
                 content_state = self.content_type_states.get(state_key)
                 if content_state:
                     content_state.mark_completed()
+                    if content_state is self._current_content_state:
+                        self._current_content_state = None
 
                     if self.use_rich and self.content_task:
-                        self.progress.update(self.content_task, completed=content_state.total)
+                        self._discard_pending_display()
+                        self._update_task(self.content_task, completed=content_state.total)
 
-                    self.stats['content_types_processed'] += 1
+                    self._stats['content_types_processed'] += 1
 
                     # Update course progress
                     course_state = self.course_states.get(self.current_course_id)
@@ -518,11 +778,11 @@ class ProgressTracker:
 
                         if self.use_rich and self.course_task:
                             progress_percentage = course_state.percentage
-                            self.progress.update(self.course_task, completed=progress_percentage)
+                            self._update_task(self.course_task, completed=progress_percentage)
 
-            self._trigger_callbacks('content_type_completed', content_type)
+        self._trigger_callbacks('content_type_completed', content_type)
 
-            self.logger.info(f"Completed content type", content_type=content_type)
+        self.logger.info("Completed content type", content_type=content_type)
 
     def complete_course(self, course_id: str = None) -> None:
         """
@@ -531,6 +791,7 @@ class ProgressTracker:
         Args:
             course_id: Course ID (uses current if not specified)
         """
+        course_state = None
         with self._lock:
             if course_id is None:
                 course_id = self.current_course_id
@@ -544,15 +805,16 @@ class ProgressTracker:
                 self.application_state.update_progress()
 
                 if self.use_rich and self.main_task:
-                    self.progress.update(self.main_task, advance=1)
+                    self._update_task(self.main_task, advance=1)
 
-                self.stats['courses_processed'] += 1
+                self._stats['courses_processed'] += 1
 
-                self._trigger_callbacks('course_completed', course_state.name, course_id)
+        if course_state is not None:
+            self._trigger_callbacks('course_completed', course_state.name, course_id)
 
-                self.logger.info(f"Completed course",
-                               course_name=course_state.name,
-                               course_id=course_id)
+            self.logger.info("Completed course",
+                           course_name=course_state.name,
+                           course_id=course_id)
 
     def report_error(self, error_message: str, level: ProgressLevel = ProgressLevel.ITEM) -> None:
         """
@@ -562,25 +824,26 @@ class ProgressTracker:
             error_message: Description of the error
             level: Level at which the error occurred
         """
-        with self._lock:
-            self.stats['errors_encountered'] += 1
+        self._counters['errors_encountered'].add()
 
-            if level == ProgressLevel.COURSE and self.current_course_id:
+        # Only errors that mark a course or content type need the lock
+        if level == ProgressLevel.COURSE and self.current_course_id:
+            with self._lock:
                 course_state = self.course_states.get(self.current_course_id)
                 if course_state:
                     course_state.mark_error(error_message)
 
-            elif level == ProgressLevel.CONTENT_TYPE and self.current_content_type:
-                state_key = f"{self.current_course_id}:{self.current_content_type}"
-                content_state = self.content_type_states.get(state_key)
+        elif level == ProgressLevel.CONTENT_TYPE:
+            with self._lock:
+                content_state = self._current_content_state
                 if content_state:
                     content_state.mark_error(error_message)
 
-            self._trigger_callbacks('error_occurred', error_message, level)
+        self._trigger_callbacks('error_occurred', error_message, level)
 
-            self.logger.error(f"Progress tracker error",
-                            level=level.value,
-                            error=error_message)
+        self.logger.error("Progress tracker error",
+                        level=level.value,
+                        error=error_message)
 
     def report_warning(self, warning_message: str) -> None:
         """
@@ -589,65 +852,87 @@ class ProgressTracker:
         Args:
             warning_message: Description of the warning
         """
-        with self._lock:
-            self.stats['warnings_encountered'] += 1
+        self._counters['warnings_encountered'].add()
 
-            # Add warning to current states
-            if self.current_course_id:
-                course_state = self.course_states.get(self.current_course_id)
-                if course_state:
-                    course_state.add_warning(warning_message)
+        # Add warning to current states; a list append needs no tracker lock
+        course_id = self.current_course_id
+        if course_id:
+            course_state = self.course_states.get(course_id)
+            if course_state:
+                course_state.add_warning(warning_message)
 
-            self.logger.warning(f"Progress tracker warning", warning=warning_message)
+        self.logger.warning("Progress tracker warning", warning=warning_message)
 
     def get_current_progress(self) -> Dict[str, Any]:
         """
         Get the current progress state across all levels.
 
+        Readers do not take the tracker lock: the current context is read
+        once and state lookups are single dict operations, so a refresh never
+        stalls the download workers updating progress.
+
         Returns:
             Dict[str, Any]: Current progress information
         """
-        with self._lock:
-            progress_info = {
-                'application': {
-                    'current': self.application_state.current,
-                    'total': self.application_state.total,
-                    'percentage': self.application_state.percentage,
-                    'status': self.application_state.status
-                },
-                'statistics': self.stats.copy(),
-                'current_context': {
-                    'course_id': self.current_course_id,
-                    'content_type': self.current_content_type,
-                    'item_id': self.current_item_id
-                }
+        course_id = self.current_course_id
+        content_type = self.current_content_type
+
+        progress_info = {
+            'application': {
+                'current': self.application_state.current,
+                'total': self.application_state.total,
+                'percentage': self.application_state.percentage,
+                'status': self.application_state.status
+            },
+            'statistics': self.get_overall_statistics(),
+            'current_context': {
+                'course_id': course_id,
+                'content_type': content_type,
+                'item_id': self.current_item_id
             }
+        }
 
-            # Add current course info
-            if self.current_course_id and self.current_course_id in self.course_states:
-                course_state = self.course_states[self.current_course_id]
-                progress_info['current_course'] = {
-                    'name': course_state.name,
-                    'current': course_state.current,
-                    'total': course_state.total,
-                    'percentage': course_state.percentage,
-                    'status': course_state.status
+        # Add current course info
+        course_state = self.course_states.get(course_id) if course_id else None
+        if course_state:
+            progress_info['current_course'] = {
+                'name': course_state.name,
+                'current': course_state.current,
+                'total': course_state.total,
+                'percentage': course_state.percentage,
+                'status': course_state.status
+            }
+
+        # Add current content type info
+        if content_type and course_id:
+            content_state = self.content_type_states.get(f"{course_id}:{content_type}")
+            if content_state:
+                progress_info['current_content_type'] = {
+                    'name': content_state.name,
+                    'current': content_state.current,
+                    'total': content_state.total,
+                    'percentage': content_state.percentage,
+                    'status': content_state.status
                 }
 
-            # Add current content type info
-            if self.current_content_type and self.current_course_id:
-                state_key = f"{self.current_course_id}:{self.current_content_type}"
-                if state_key in self.content_type_states:
-                    content_state = self.content_type_states[state_key]
-                    progress_info['current_content_type'] = {
-                        'name': content_state.name,
-                        'current': content_state.current,
-                        'total': content_state.total,
-                        'percentage': content_state.percentage,
-                        'status': content_state.status
-                    }
-
-            return progress_info
+        return progress_info
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the overall statistics; same as get_overall_statistics()."""
+        return self.get_overall_statistics()
+
+    def get_overall_statistics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the overall statistics without taking the lock.
+
+        Returns:
+            Dict[str, Any]: Copy of the statistics counters
+        """
+        stats = dict(self._stats)
+        for name, counter in self._counters.items():
+            stats[name] = counter.value
+        return stats
 
     def display_summary(self) -> None:
         """Display a summary of all progress and statistics."""
@@ -658,6 +943,7 @@ class ProgressTracker:
 
     def _display_rich_summary(self) -> None:
         """Display summary using Rich formatting."""
+        stats = self.get_overall_statistics()
         table = Table(title="Canvas Downloader Progress Summary")
 
         table.add_column("Category", style="cyan", no_wrap=True)
@@ -667,37 +953,37 @@ class ProgressTracker:
         # Application stats
         table.add_row(
             "Courses Processed",
-            str(self.stats['courses_processed']),
+            str(stats['courses_processed']),
             f"{self.application_state.percentage:.1f}% complete"
         )
 
         table.add_row(
             "Content Types",
-            str(self.stats['content_types_processed']),
+            str(stats['content_types_processed']),
             "assignments, modules, etc."
         )
 
         table.add_row(
             "Items Processed",
-            str(self.stats['items_processed']),
+            str(stats['items_processed']),
             "files, assignments, etc."
         )
 
         table.add_row(
             "Data Downloaded",
-            self._format_bytes(self.stats['total_bytes_downloaded']),
+            self._format_bytes(stats['total_bytes_downloaded']),
             "total size"
         )
 
         table.add_row(
             "Errors",
-            str(self.stats['errors_encountered']),
+            str(stats['errors_encountered']),
             "issues encountered"
         )
 
         table.add_row(
             "Warnings",
-            str(self.stats['warnings_encountered']),
+            str(stats['warnings_encountered']),
             "non-critical issues"
         )
 
@@ -705,24 +991,29 @@ class ProgressTracker:
 
     def _display_simple_summary(self) -> None:
         """Display summary using simple console output."""
+        stats = self.get_overall_statistics()
         print("\n" + "="*60)
         print("CANVAS DOWNLOADER PROGRESS SUMMARY")
         print("="*60)
-        print(f"Courses Processed: {self.stats['courses_processed']}")
-        print(f"Content Types: {self.stats['content_types_processed']}")
-        print(f"Items Processed: {self.stats['items_processed']}")
-        print(f"Data Downloaded: {self._format_bytes(self.stats['total_bytes_downloaded'])}")
-        print(f"Errors: {self.stats['errors_encountered']}")
-        print(f"Warnings: {self.stats['warnings_encountered']}")
+        print(f"Courses Processed: {stats['courses_processed']}")
+        print(f"Content Types: {stats['content_types_processed']}")
+        print(f"Items Processed: {stats['items_processed']}")
+        print(f"Data Downloaded: {self._format_bytes(stats['total_bytes_downloaded'])}")
+        print(f"Errors: {stats['errors_encountered']}")
+        print(f"Warnings: {stats['warnings_encountered']}")
         print("="*60)
 
     def _format_bytes(self, bytes_count: int) -> str:
         """Format byte count into human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_count < 1024.0:
-                return f"{bytes_count:.1f} {unit}"
-            bytes_count /= 1024.0
-        return f"{bytes_count:.1f} PB"
+        # Each unit is 10 bits wide, so the bit length picks it directly
+        unit_idx = min(max(0, (int(bytes_count).bit_length() - 1) // 10), 5)
+        value = bytes_count / (1 << (unit_idx * 10))
+        return f"{value:.1f} {_BYTE_UNITS[unit_idx]}"
+
+    def _format_hms(self, seconds: float) -> str:
+        """Format a duration in seconds as H:MM:SS."""
+        s = int(seconds)
+        return f"{s // 3600:d}:{(s // 60) % 60:02d}:{s % 60:02d}"
 
     def save_progress_report(self, file_path: Union[str, Path]) -> None:
         """
@@ -732,8 +1023,6 @@ class ProgressTracker:
             file_path: Path where to save the report
         """
         try:
-            import json
-
             report_data = {
                 'generated_at': datetime.now().isoformat(),
                 'application_state': {
@@ -741,26 +1030,26 @@ class ProgressTracker:
                     'total': self.application_state.total,
                     'percentage': self.application_state.percentage,
                     'status': self.application_state.status,
-                    'duration': str(self.application_state.duration) if self.application_state.duration else None
+                    'duration': self._format_hms(self.application_state.duration.total_seconds()) if self.application_state.duration else None
                 },
-                'statistics': self.stats,
+                'statistics': self.get_overall_statistics(),
                 'course_details': {},
                 'content_type_details': {}
             }
 
-            # Add course details
-            for course_id, course_state in self.course_states.items():
+            # Add course details (iterate snapshots; workers may still add states)
+            for course_id, course_state in list(self.course_states.items()):
                 report_data['course_details'][course_id] = {
                     'name': course_state.name,
                     'status': course_state.status,
                     'percentage': course_state.percentage,
-                    'duration': str(course_state.duration) if course_state.duration else None,
+                    'duration': self._format_hms(course_state.duration.total_seconds()) if course_state.duration else None,
                     'warnings': course_state.warnings,
                     'error': course_state.error_message
                 }
 
             # Add content type details
-            for state_key, content_state in self.content_type_states.items():
+            for state_key, content_state in list(self.content_type_states.items()):
                 report_data['content_type_details'][state_key] = {
                     'name': content_state.name,
                     'current': content_state.current,
@@ -772,13 +1061,27 @@ class ProgressTracker:
                     'items_failed': content_state.items_failed
                 }
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, default=str)
-
-            self.logger.info(f"Progress report saved", file_path=str(file_path))
+            # Encode the whole report up front and write it in one call;
+            # json.dump would issue a write per token
+            payload = None
+            if ORJSON_AVAILABLE:
+                try:
+                    payload = orjson.dumps(
+                        report_data, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                except TypeError:
+                    pass
+            if payload is None:
+                payload = json.dumps(report_data, indent=2, default=str).encode('utf-8')
+
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+
+            self.logger.info("Progress report saved", file_path=str(file_path))
 
         except Exception as e:
-            self.logger.error(f"Failed to save progress report", exception=e)
+            self.logger.error("Failed to save progress report", exception=e)
 
     def reset(self) -> None:
         """Reset all progress states and statistics."""
@@ -794,16 +1097,11 @@ class ProgressTracker:
             self.current_course_id = None
             self.current_content_type = None
             self.current_item_id = None
+            self._current_content_state = None
 
             # Reset statistics
-            self.stats = {
-                'courses_processed': 0,
-                'content_types_processed': 0,
-                'items_processed': 0,
-                'total_bytes_downloaded': 0,
-                'errors_encountered': 0,
-                'warnings_encountered': 0
-            }
+            self._counters = {name: _AtomicCounter() for name in _ATOMIC_STATS}
+            self._stats.update(_INITIAL_STATS)
 
             self.logger.info("Progress tracker reset")
 
@@ -814,22 +1112,24 @@ class ProgressTracker:
         This method provides compatibility with the orchestrator's expected interface
         by updating the overall application progress based on completed courses.
         """
-        with self._lock:
-            if self.application_state.total > 0:
-                # Calculate progress based on completed courses
-                completed_courses = len([
-                    state for state in self.course_states.values()
-                    if state.status == "completed"
-                ])
-                self.application_state.update_progress(current=completed_courses)
+        # Check the total before taking the lock; without one there is nothing to update
+        if self.application_state.total > 0:
+            with self._lock:
+                if self.application_state.total > 0:
+                    # Calculate progress based on completed courses
+                    completed_courses = len([
+                        state for state in self.course_states.values()
+                        if state.status == "completed"
+                    ])
+                    self.application_state.update_progress(current=completed_courses)
 
-                # Update rich progress if available
-                if self.use_rich and self.progress and self.main_task is not None:
-                    self.progress.update(self.main_task, completed=completed_courses)
+                    # Update rich progress if available
+                    if self.use_rich and self.progress and self.main_task is not None:
+                        self._update_task(self.main_task, completed=completed_courses)
 
-                self._trigger_callbacks('progress_updated', self.application_state)
+            self._trigger_callbacks('progress_updated', self.application_state)
 
-            self.logger.debug("Updated application progress")
+        self.logger.debug("Updated application progress")
 
     def update_current_item(self, item_name: str) -> None:
         if not hasattr(self, '_current_item_index'):
@@ -837,6 +1137,19 @@ class ProgressTracker:
         self._current_item_index += 1
         self.update_item_progress(self._current_item_index, item_name)
 
+    def cleanup(self) -> None:
+        """Stop the display thread and apply any pending updates and callbacks."""
+        with self._display_lock:
+            thread, self._display_thread = self._display_thread, None
+        if thread is None:
+            return
+
+        self._display_stop.set()
+        self._display_dirty.set()
+        thread.join()
+        self._display_stop.clear()
+        self._flush_display()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -847,6 +1160,7 @@ class ProgressTracker:
             self.report_error(f"Exception occurred: {exc_val}", ProgressLevel.APPLICATION)
 
         # Display final summary
+        self.cleanup()
         self.display_summary()
 
 
@@ -13,26 +13,190 @@ CHANGES MADE:
 This solves the PDF detection issue while preserving the original project design.
 """
 
+import asyncio
+import http.cookiejar
+import http.cookies
 import requests
+import random
 import re
+import shutil
+import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from urllib.parse import urljoin, urlparse, unquote
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from urllib.parse import urljoin, urlparse, unquote, parse_qs
 from dataclasses import dataclass
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from bs4 import BeautifulSoup
+    from bs4.element import Tag
     BEAUTIFULSOUP_AVAILABLE = True
 except ImportError:
     print("BeautifulSoup not available. Install with: pip install beautifulsoup4")
     BEAUTIFULSOUP_AVAILABLE = False
 
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import aiohttp
+    import aiofiles
+    from yarl import URL
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from ..utils.logger import get_logger
 
+# Upper bound on concurrent Canvas API lookups while resolving one module page
+RESOLVE_MAX_WORKERS = 8
+
+# The C-based lxml parser handles large module pages faster than html.parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Connection pools kept per host and connections kept per pool by the requests session
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# Transient responses retried by the requests session before giving up
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Page size for Canvas API listings; Canvas defaults to 10 and caps at 100
+CANVAS_PAGE_SIZE = 100
+
+# Minimum seconds between retries of modules whose items could not be listed
+MODULE_ITEMS_RETRY_INTERVAL = 30
+
+# Upper bound on module pages fetched at once by extract_many_modules
+MODULE_FETCH_CONCURRENCY = 16
+
+# Default number of files downloaded at once by download_files/download_files_async
+DOWNLOAD_MAX_WORKERS = 8
+
+# Copy buffer size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Read size for streamed async downloads
+ASYNC_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# URL patterns
+_MODULE_ITEM_URL_RE = re.compile(r'/courses/(\d+)/modules/items/(\d+)')
+_FILE_ID_RE = re.compile(r'/files/(\d+)')
+# Canvas file IDs or a known document extension, as one alternation
+_FILE_LINK_RE = re.compile(r'/files/\d+|\.(?:pdf|docx?|pptx?|xlsx?|txt|zip|jpg|png)(?:$|\?)', re.IGNORECASE)
+
+# Filename and size patterns in link text and attributes
+_FILENAME_IN_TEXT_RE = re.compile(r'([^/\\:*?"<>|]+\.[a-zA-Z0-9]{1,5})')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_SIZE_IN_PARENS_RE = re.compile(r'\(([0-9.]+\s*[KMGT]?B)\)')
+_SIZE_RE = re.compile(r'\b([0-9.]+\s*[KMGT]?B)\b')
+
+# Display names of file types by extension
+_FILE_TYPES = {
+    '.pdf': 'PDF Document',
+    '.doc': 'Word Document', '.docx': 'Word Document',
+    '.ppt': 'PowerPoint', '.pptx': 'PowerPoint',
+    '.xls': 'Excel Spreadsheet', '.xlsx': 'Excel Spreadsheet',
+    '.txt': 'Text File', '.zip': 'Archive',
+    '.jpg': 'Image', '.jpeg': 'Image', '.png': 'Image', '.gif': 'Image',
+}
+
+# Download retry backoff: 2 ** attempt seconds, capped, scaled by a random jitter factor
+RETRY_BACKOFF_CAP = 60
+RETRY_JITTER = (0.5, 1.5)
+
+# Query parameters and link attributes that may carry a filename
+_FILENAME_QUERY_PARAMS = ('filename', 'name', 'file', 'attachment')
+_FILENAME_ATTRIBUTES = ('title', 'data-filename', 'aria-label')
+
+# Page structure patterns matched against element classes and hrefs
+_MODULE_ITEM_CLASS_RE = re.compile(r'.*module.*item.*|.*context_module_item.*')
+_MODULE_ITEM_FILE_HREF_RE = re.compile(r'.*/files/.*|.*\.pdf|.*\.docx?|.*\.pptx?|.*\.xlsx?')
+_ATTACHMENT_CLASS_RE = re.compile(r'.*attachment.*|.*file.*')
+_MODULE_TITLE_CLASS_RE = re.compile(r'.*module.*title.*')
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Seconds to wait before retrying a failed download.
+
+    Exponential backoff with jitter, so downloads that fail together do not
+    retry together; a Retry-After header on the failed response wins when
+    it asks for longer.
+
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        error: Exception raised by the attempt
+
+    Returns:
+        float: Delay in seconds
+    """
+    delay = min(RETRY_BACKOFF_CAP, 2 ** attempt) * random.uniform(*RETRY_JITTER)
+
+    # requests errors carry the response; aiohttp errors carry its headers
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or getattr(error, 'headers', None) or {}
+    try:
+        delay = max(delay, float(headers.get('Retry-After', 0)))
+    except (TypeError, ValueError):
+        pass  # HTTP-date form; keep the backoff
+
+    return delay
+
+
+@lru_cache(maxsize=4096)
+def _filename_from_url(href: str) -> Optional[str]:
+    """
+    Get a filename from a link URL's path, or failing that its query parameters.
+
+    Cached because the same file is often linked from several module items.
+
+    Args:
+        href: Link URL
+
+    Returns:
+        Optional[str]: Filename, or None if the URL does not carry one
+    """
+    # Fast path for plain absolute URLs: no query, fragment or parameters to split off
+    if href.startswith(('https://', 'http://')) and not any(c in href for c in '?#;'):
+        path_start = href.find('/', href.index('://') + 3)
+        if path_start < 0:
+            return None
+        path_filename = unquote(href[path_start:]).rsplit('/', 1)[-1]
+        if '.' in path_filename and len(path_filename) > 1:
+            return path_filename
+
+    parsed = urlparse(href)
+    path_filename = Path(unquote(parsed.path)).name
+    if path_filename and '.' in path_filename and len(path_filename) > 1:
+        return path_filename
+
+    if parsed.query:
+        query_params = parse_qs(parsed.query)
+        for param in _FILENAME_QUERY_PARAMS:
+            if param in query_params and query_params[param]:
+                filename = unquote(query_params[param][0])
+                if '.' in filename:
+                    return filename
 
-@dataclass
+    return None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FileInfo:
     """Information about a file found on Canvas."""
     filename: str
@@ -52,7 +216,8 @@ class WebContentExtractor:
     by extracting content_id and using the Canvas API to get the real download links.
     """
 
-    def __init__(self, cookies_path: str, base_url: str = None, canvas_client=None):
+    def __init__(self, cookies_path: str, base_url: str = None, canvas_client=None,
+                 resolution_cache_path: Optional[Path] = None, resolution_cache_ttl_hours: int = 24):
         """
         Initialize the web content extractor.
 
@@ -60,14 +225,66 @@ class WebContentExtractor:
             cookies_path: Path to browser cookies file
             base_url: Canvas base URL (auto-detected if None)
             canvas_client: Canvas API client for URL resolution (REQUIRED FOR FIX)
+            resolution_cache_path: JSON file persisting module item resolutions
+                across runs (disabled if None)
+            resolution_cache_ttl_hours: Age after which persisted resolutions are ignored
         """
         self.cookies_path = cookies_path
         self.base_url = base_url
         self.canvas_client = canvas_client  # NEW: Canvas API client for file resolution
         self.logger = get_logger(__name__)
 
-        # Initialize requests session
+        # Canvas API lookups shared by every link of a course. Only
+        # successful resolutions are cached so transient failures are retried.
+        self._course_cache: Dict[str, Any] = {}
+        self._module_items_cache: Dict[str, Dict[str, Any]] = {}  # course_id -> {module_item_id: item}
+        self._course_files_index: Dict[str, Dict[str, str]] = {}  # course_id -> {file_id: url}
+        self._file_url_cache: Dict[str, str] = {}  # content_id -> download URL of a fetched file
+        self._resolved_url_cache: Dict[str, Tuple[str, Optional[str]]] = {}  # module_item_id -> (url, content_id)
+        self._failed_modules: Dict[str, Tuple[float, List[Any]]] = {}  # course_id -> (last attempt, modules)
+
+        # Each course lookup is filled under its own lock, so API calls for
+        # one course never hold up another; _api_cache_lock only guards
+        # _course_locks and is never held across a request.
+        self._course_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._api_cache_lock = threading.Lock()
+
+        # File links parsed from module pages, with the page validators, revalidated
+        # with conditional GETs. Links are kept unresolved: download URLs expire and
+        # failed resolutions must be retried, so they are resolved on every use.
+        self._page_cache: Dict[str, Tuple[Optional[str], Optional[str], List[Tuple]]] = {}  # url -> (etag, last_modified, page links)
+
+        # Module item resolutions persisted across runs. Only the file ID is
+        # stored: download URLs carry expiring signatures and are re-fetched.
+        self.resolution_cache_path = Path(resolution_cache_path) if resolution_cache_path else None
+        self.resolution_cache_ttl = resolution_cache_ttl_hours * 3600
+        self._persisted_resolutions = self._load_resolution_cache()
+        self._persisted_resolutions_dirty = False
+        self._resolution_cache_lock = threading.Lock()
+
+        # Initialize requests session. Larger pools keep connections alive
+        # under concurrent use, and transient errors are retried with backoff.
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=HTTP_RETRY_STATUSES,
+                              raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # File downloads retry in download_file itself, so they go through a
+        # session without adapter-level retries that share the same cookies
+        self._download_session = requests.Session()
+        self._download_session.cookies = self.session.cookies
+        download_adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE
+        )
+        self._download_session.mount('https://', download_adapter)
+        self._download_session.mount('http://', download_adapter)
 
         # Load cookies if available
         if self.cookies_path and Path(self.cookies_path).exists():
@@ -75,31 +292,50 @@ class WebContentExtractor:
         else:
             self.logger.warning(f"Cookies file not found: {cookies_path}")
 
+        # Detect the Canvas URL once, now that cookies are loaded
+        if not self.base_url:
+            self.base_url = self._detect_canvas_url()
+
     def _load_cookies(self):
         """Load cookies from file for web authentication."""
         try:
-            with open(self.cookies_path, 'r', encoding='utf-8') as f:
-                cookies_text = f.read()
-
-            # Parse Netscape cookie format
-            for line in cookies_text.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    parts = line.split('\t')
-                    if len(parts) >= 7:
-                        domain, _, path, _, _, name, value = parts[:7]
-                        self.session.cookies.set(name, value, domain=domain, path=path)
+            try:
+                # Keep session and expired cookies: the file is an explicit export
+                cookie_jar = http.cookiejar.MozillaCookieJar(self.cookies_path)
+                cookie_jar.load(ignore_discard=True, ignore_expires=True)
+                self.session.cookies.update(cookie_jar)
+
+            except http.cookiejar.LoadError as e:
+                # Missing header line or malformed entries; parse leniently instead
+                self.logger.debug(f"Falling back to lenient cookie parsing: {e}")
+                self._load_cookies_leniently()
 
             self.logger.info(f"Loaded {len(self.session.cookies)} cookies from {self.cookies_path}")
 
         except Exception as e:
             self.logger.error(f"Failed to load cookies", exception=e)
 
-    def _extract_file_info_from_link(self, link, course_id: str) -> Optional[FileInfo]:
+    def _load_cookies_leniently(self):
+        """Parse a Netscape cookie file line by line, skipping entries that do not fit."""
+        with open(self.cookies_path, 'r', encoding='utf-8') as f:
+            cookies_text = f.read()
+
+        # Parse Netscape cookie format
+        for line in cookies_text.split('\n'):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                parts = line.split('\t')
+                if len(parts) >= 7:
+                    domain, _, path, _, _, name, value = parts[:7]
+                    self.session.cookies.set(name, value, domain=domain, path=path)
+
+    def _prepare_link(self, link) -> Optional[Tuple[str, str, str]]:
         """
-        FIXED: Extract file information from a link element.
+        Get the absolute href, filename and text of a link element.
 
-        Now properly resolves Canvas module item URLs to actual file download URLs.
+        Returns:
+            Optional[Tuple[str, str, str]]: (href, filename, link_text), or None
+            if the link has no href or no recognisable filename
         """
         try:
             href = link.get('href', '')
@@ -111,32 +347,105 @@ class WebContentExtractor:
                 href = urljoin(self.base_url, href)
 
             # Extract filename from link text or attributes
-            filename = self._extract_filename_from_element(link, href)
+            link_text = link.get_text(strip=True)
+            filename = self._extract_filename_from_element(link, href, link_text)
             if not filename:
                 return None
 
-            # CORE FIX: Resolve Canvas module item URLs to actual file URLs
-            actual_file_url, content_id = self._resolve_canvas_file_url(href, course_id)
+            return href, filename, link_text
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting file info from link", exception=e)
+            return None
+
+    def _resolve_file_urls(self, hrefs: List[str], course_id: str) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Resolve several link URLs to download URLs.
+
+        Resolution is dominated by Canvas API round-trips, so the lookups run
+        on a small thread pool instead of one after another.
+
+        Args:
+            hrefs: Unique absolute link URLs
+            course_id: Canvas course ID
+
+        Returns:
+            Dict[str, Tuple[Optional[str], Optional[str]]]: href -> (download_url, content_id)
+        """
+        if len(hrefs) <= 1:
+            return {href: self._resolve_canvas_file_url(href, course_id) for href in hrefs}
+
+        with ThreadPoolExecutor(max_workers=min(RESOLVE_MAX_WORKERS, len(hrefs)),
+                                thread_name_prefix='resolve-file-url') as executor:
+            results = executor.map(lambda href: self._resolve_canvas_file_url(href, course_id), hrefs)
+            return dict(zip(hrefs, results))
+
+    def _parse_page_links(self, content: bytes) -> List[Tuple[str, str, str, Optional[str], str]]:
+        """
+        Parse a module page into the file links it contains, unresolved.
+
+        Args:
+            content: Module page HTML
+
+        Returns:
+            List[Tuple[str, str, str, Optional[str], str]]:
+                (href, filename, link_text, size, module_name) per link
+        """
+        soup = BeautifulSoup(content, HTML_PARSER)
+
+        page_links = []
+        for link, module_name in self._collect_file_links(soup):
+            link_info = self._prepare_link(link)
+            if link_info:
+                href, filename, link_text = link_info
+                page_links.append((href, filename, link_text,
+                                   self._extract_file_size(link, link_text), module_name))
+        return page_links
+
+    def _build_file_infos(self, page_links: List[Tuple[str, str, str, Optional[str], str]],
+                          course_id: str) -> List[FileInfo]:
+        """
+        FIXED: Build file information for the file links of a page.
 
+        Canvas module item URLs are resolved to actual file download URLs;
+        links that cannot be resolved are dropped.
+
+        Args:
+            page_links: Links from _parse_page_links
+            course_id: Canvas course ID
+
+        Returns:
+            List[FileInfo]: Files with resolved download URLs
+        """
+        # CORE FIX: Resolve Canvas module item URLs to actual file URLs,
+        # once per distinct URL
+        resolved = self._resolve_file_urls(
+            list(dict.fromkeys(href for href, _, _, _, _ in page_links)), course_id
+        )
+        self._save_resolution_cache()
+
+        files = []
+        for href, filename, link_text, size, module_name in page_links:
+            actual_file_url, content_id = resolved[href]
             if not actual_file_url:
                 self.logger.debug(f"Could not resolve file URL for: {href}")
-                return None
-
-            # Create FileInfo with the resolved download URL
-            file_info = FileInfo(
-                filename=filename,
-                url=actual_file_url,  # Use resolved download URL instead of module item URL
-                file_type=self._determine_file_type(actual_file_url, filename),
-                size=self._extract_file_size(link),
-                item_title=link.get_text(strip=True),
-                content_id=content_id
-            )
+                continue
 
-            return file_info
+            try:
+                # Create FileInfo with the resolved download URL
+                files.append(FileInfo(
+                    filename=filename,
+                    url=actual_file_url,  # Use resolved download URL instead of module item URL
+                    file_type=self._determine_file_type(actual_file_url, filename),
+                    size=size,
+                    module_name=module_name,
+                    item_title=link_text,
+                    content_id=content_id
+                ))
+            except Exception as e:
+                self.logger.debug(f"Error extracting file info from link", exception=e)
 
-        except Exception as e:
-            self.logger.debug(f"Error extracting file info from link", exception=e)
-            return None
+        return files
 
     def _resolve_canvas_file_url(self, url: str, course_id: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -153,52 +462,55 @@ class WebContentExtractor:
         """
         try:
             # Check if this is a Canvas module item URL
-            module_item_match = re.search(r'/courses/(\d+)/modules/items/(\d+)', url)
+            module_item_match = _MODULE_ITEM_URL_RE.search(url)
             if not module_item_match:
                 # Not a module item URL, might be a direct file URL
                 if '/files/' in url:
-                    return url, self._extract_content_id_from_url(url)
+                    return self._resolve_direct_file_url(url, course_id)
                 return None, None
 
             course_id_from_url = module_item_match.group(1)
             module_item_id = module_item_match.group(2)
 
+            resolved = self._resolved_url_cache.get(module_item_id)
+            if resolved:
+                return resolved
+
             # Use Canvas API to get the module item details
             if not self.canvas_client:
                 self.logger.warning("Canvas API client not available for URL resolution")
                 return None, None
 
-            try:
-                # Get the course object
-                course = self.canvas_client.get_course(course_id)
-
-                # Find the module that contains this item
-                modules = course.get_modules()
+            persisted_key = f"{course_id}:{module_item_id}"
+            resolved = self._resolve_from_persisted(persisted_key, course_id)
+            if resolved:
+                self._resolved_url_cache[module_item_id] = resolved
+                return resolved
 
-                for module in modules:
-                    try:
-                        module_items = module.get_module_items()
-                        for item in module_items:
-                            if str(item.id) == module_item_id:
-                                # Found the module item!
-                                if hasattr(item, 'content_id') and item.content_id:
-                                    # This is a file item, get the actual file
-                                    try:
-                                        file_obj = course.get_file(item.content_id)
-                                        download_url = getattr(file_obj, 'url', None)
-                                        if download_url:
-                                            self.logger.info(f"Resolved module item {module_item_id} to file URL: {download_url[:100]}...")
-                                            return download_url, str(item.content_id)
-                                    except Exception as e:
-                                        self.logger.debug(f"Could not get file for content_id {item.content_id}: {e}")
-
-                                elif hasattr(item, 'url') and item.url:
-                                    # Might be an external URL or other type
-                                    return item.url, None
-
-                    except Exception as e:
-                        self.logger.debug(f"Error processing module items: {e}")
-                        continue
+            try:
+                course, module_items = self._get_module_items_index(course_id, module_item_id)
+
+                item = module_items.get(module_item_id)
+                if item is not None:
+                    # Found the module item!
+                    if hasattr(item, 'content_id') and item.content_id:
+                        # This is a file item, get the actual file
+                        try:
+                            download_url = self._get_file_download_url(course, course_id, item.content_id)
+                            if download_url:
+                                self.logger.info(f"Resolved module item {module_item_id} to file URL: {download_url[:100]}...")
+                                resolved = (download_url, str(item.content_id))
+                        except Exception as e:
+                            self.logger.debug(f"Could not get file for content_id {item.content_id}: {e}")
+
+                    elif hasattr(item, 'url') and item.url:
+                        # Might be an external URL or other type
+                        resolved = (item.url, None)
+
+                if resolved:
+                    self._resolved_url_cache[module_item_id] = resolved
+                    self._persist_resolution(persisted_key, resolved)
+                    return resolved
 
             except Exception as e:
                 self.logger.debug(f"Error accessing Canvas API for URL resolution: {e}")
@@ -209,11 +521,237 @@ class WebContentExtractor:
             self.logger.debug(f"Error resolving Canvas file URL: {e}")
             return None, None
 
+    def _load_resolution_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load unexpired persisted module item resolutions."""
+        if not self.resolution_cache_path or not self.resolution_cache_path.exists():
+            return {}
+
+        try:
+            with open(self.resolution_cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+
+            oldest = time.time() - self.resolution_cache_ttl
+            return {key: entry for key, entry in entries.items()
+                    if entry.get('cached_at', 0) >= oldest}
+
+        except Exception as e:
+            self.logger.warning(f"Could not load resolution cache", exception=e)
+            return {}
+
+    def _save_resolution_cache(self) -> None:
+        """Write persisted module item resolutions back if any were added."""
+        if not self.resolution_cache_path:
+            return
+
+        with self._resolution_cache_lock:
+            if not self._persisted_resolutions_dirty:
+                return
+
+            try:
+                self.resolution_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.resolution_cache_path.with_suffix('.tmp')
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._persisted_resolutions, f)
+                temp_path.replace(self.resolution_cache_path)
+                self._persisted_resolutions_dirty = False
+
+            except Exception as e:
+                self.logger.warning(f"Could not save resolution cache", exception=e)
+
+    def _persist_resolution(self, key: str, resolved: Tuple[str, Optional[str]]) -> None:
+        """Remember a module item resolution for later runs."""
+        if not self.resolution_cache_path:
+            return
+
+        url, content_id = resolved
+        entry = {'content_id': content_id} if content_id else {'url': url}
+        entry['cached_at'] = time.time()
+
+        with self._resolution_cache_lock:
+            self._persisted_resolutions[key] = entry
+            self._persisted_resolutions_dirty = True
+
+    def _resolve_from_persisted(self, key: str, course_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Resolve a module item from a persisted resolution, skipping the module walk.
+
+        Args:
+            key: "<course_id>:<module_item_id>"
+            course_id: Canvas course ID
+
+        Returns:
+            Optional[Tuple[str, Optional[str]]]: (download_url, content_id), or
+            None if nothing usable is persisted
+        """
+        entry = self._persisted_resolutions.get(key)
+        if not entry or time.time() - entry.get('cached_at', 0) > self.resolution_cache_ttl:
+            return None
+
+        try:
+            content_id = entry.get('content_id')
+            if content_id:
+                course = self._get_course(course_id)
+                download_url = self._get_file_download_url(course, course_id, content_id)
+                if download_url:
+                    return download_url, content_id
+            elif entry.get('url'):
+                return entry['url'], None
+
+        except Exception as e:
+            self.logger.debug(f"Could not use persisted resolution for {key}: {e}")
+
+        return None
+
+    def _resolve_direct_file_url(self, url: str, course_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a direct Canvas file URL to the file's API download URL.
+
+        A /files/<id> link usually points at the file's preview page rather
+        than its content. The link itself is kept when the file cannot be
+        looked up, e.g. without an API client or for another course's file.
+
+        Args:
+            url: Canvas file URL (like /courses/123/files/456)
+            course_id: Canvas course ID
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: (download_url, content_id)
+        """
+        content_id = self._extract_content_id_from_url(url)
+        if not content_id or not self.canvas_client:
+            return url, content_id
+
+        try:
+            course = self._get_course(course_id)
+            download_url = self._get_file_download_url(course, course_id, content_id)
+            if download_url:
+                return download_url, content_id
+        except Exception as e:
+            self.logger.debug(f"Could not get file for content_id {content_id}: {e}")
+
+        return url, content_id
+
+    def _course_lock(self, kind: str, course_id: str) -> threading.Lock:
+        """Get the lock guarding one kind of cached lookup for a course."""
+        with self._api_cache_lock:
+            return self._course_locks.setdefault((kind, course_id), threading.Lock())
+
+    def _get_course(self, course_id: str) -> Any:
+        """Get a Canvas course object, fetching it once."""
+        with self._course_lock('course', course_id):
+            course = self._course_cache.get(course_id)
+            if course is None:
+                course = self.canvas_client.get_course(course_id)
+                self._course_cache[course_id] = course
+
+        return course
+
+    def _get_file_download_url(self, course, course_id: str, content_id) -> Optional[str]:
+        """
+        Get a file's download URL from the course file index, or fetch the file.
+
+        A fetched file's URL is kept, so items sharing a file fetch it once.
+        """
+        key = str(content_id)
+        download_url = self._get_course_files_index(course_id, course).get(key)
+        if not download_url:
+            download_url = self._file_url_cache.get(key)
+            if not download_url:
+                download_url = getattr(course.get_file(content_id), 'url', None)
+                if download_url:
+                    self._file_url_cache[key] = download_url
+
+        return download_url
+
+    def _get_module_items_index(self, course_id: str,
+                                module_item_id: Optional[str] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Get a course and an index of all its module items, fetching them once.
+
+        The first caller for a course walks every module; concurrent callers
+        for the same course wait for that walk instead of repeating it.
+        Modules whose items could not be listed are remembered, and only
+        those are listed again when a looked-up item is missing from the
+        index, at most every MODULE_ITEMS_RETRY_INTERVAL seconds.
+
+        Args:
+            course_id: Canvas course ID
+            module_item_id: Module item about to be looked up (optional)
+
+        Returns:
+            Tuple[Any, Dict[str, Any]]: (course, {module_item_id: item})
+        """
+        course = self._get_course(course_id)
+
+        with self._course_lock('module_items', course_id):
+            module_items = self._module_items_cache.get(course_id)
+            if module_items is None:
+                module_items = {}
+                failed = self._index_module_items(course.get_modules(per_page=CANVAS_PAGE_SIZE), module_items)
+                self._failed_modules[course_id] = (time.time(), failed)
+                self._module_items_cache[course_id] = module_items
+
+            elif module_item_id is not None and module_item_id not in module_items:
+                attempted_at, failed = self._failed_modules.get(course_id, (0, []))
+                if failed and time.time() - attempted_at >= MODULE_ITEMS_RETRY_INTERVAL:
+                    failed = self._index_module_items(failed, module_items)
+                    self._failed_modules[course_id] = (time.time(), failed)
+
+        return course, module_items
+
+    def _index_module_items(self, modules, module_items: Dict[str, Any]) -> List[Any]:
+        """
+        Add the items of modules to a module items index.
+
+        Returns:
+            List[Any]: Modules whose items could not be listed
+        """
+        failed = []
+        for module in modules:
+            try:
+                for item in module.get_module_items(per_page=CANVAS_PAGE_SIZE):
+                    # First occurrence wins, as in a front-to-back scan
+                    module_items.setdefault(str(item.id), item)
+            except Exception as e:
+                self.logger.debug(f"Error processing module items: {e}")
+                failed.append(module)
+        return failed
+
+    def _get_course_files_index(self, course_id: str, course) -> Dict[str, str]:
+        """
+        Get the download URLs of all files in a course, listing them once.
+
+        Students often cannot list course files (the Files tab is hidden),
+        in which case the index stays empty and callers fall back to
+        fetching files one by one.
+
+        Args:
+            course_id: Canvas course ID
+            course: Canvas course object
+
+        Returns:
+            Dict[str, str]: {file_id: download_url}
+        """
+        with self._course_lock('files', course_id):
+            files_index = self._course_files_index.get(course_id)
+            if files_index is None:
+                files_index = {}
+                try:
+                    for file_obj in course.get_files(per_page=CANVAS_PAGE_SIZE):
+                        download_url = getattr(file_obj, 'url', None)
+                        if download_url:
+                            files_index[str(file_obj.id)] = download_url
+                except Exception as e:
+                    self.logger.debug(f"Could not list files for course {course_id}: {e}")
+                self._course_files_index[course_id] = files_index
+
+        return files_index
+
     def _extract_content_id_from_url(self, url: str) -> Optional[str]:
         """Extract content_id from a Canvas file URL."""
         try:
             # Look for file ID in URL path
-            match = re.search(r'/files/(\d+)', url)
+            match = _FILE_ID_RE.search(url)
             if match:
                 return match.group(1)
 
@@ -227,40 +765,25 @@ class WebContentExtractor:
         except Exception:
             return None
 
-    def _extract_filename_from_element(self, link, href: str) -> Optional[str]:
-        """Extract filename from link element and URL."""
+    def _extract_filename_from_element(self, link, href: str, link_text: str) -> Optional[str]:
+        """Extract filename from link element and URL, cheapest source first."""
         try:
-            # Method 1: Get from URL path
-            parsed = urlparse(href)
-            path_filename = Path(unquote(parsed.path)).name
-            if path_filename and '.' in path_filename and len(path_filename) > 1:
-                return path_filename
-
-            # Method 2: Get from query parameters
-            from urllib.parse import parse_qs
-            query_params = parse_qs(parsed.query)
-            filename_params = ['filename', 'name', 'file', 'attachment']
-            for param in filename_params:
-                if param in query_params and query_params[param]:
-                    filename = unquote(query_params[param][0])
-                    if '.' in filename:
-                        return filename
+            # Methods 1 and 2: Get from URL path or query parameters
+            filename = _filename_from_url(href)
+            if filename:
+                return filename
 
             # Method 3: Get from link text
-            link_text = link.get_text(strip=True)
             if link_text:
-                import re
-                file_pattern = r'([^/\\:*?"<>|]+\.[a-zA-Z0-9]{1,5})'
-                matches = re.findall(file_pattern, link_text)
-                if matches:
-                    return matches[0]
+                match = _FILENAME_IN_TEXT_RE.search(link_text)
+                if match:
+                    return match.group(1)
 
             # Method 4: Get from title or other attributes
-            for attr in ['title', 'data-filename', 'aria-label']:
+            for attr in _FILENAME_ATTRIBUTES:
                 attr_value = link.get(attr, '')
                 if attr_value and '.' in attr_value:
-                    import re
-                    cleaned = re.sub(r'[<>:"/\\|?*]', '_', attr_value.strip())
+                    cleaned = _UNSAFE_FILENAME_CHARS_RE.sub('_', attr_value.strip())
                     if '.' in cleaned and len(cleaned) > 1:
                         return cleaned
 
@@ -272,29 +795,19 @@ class WebContentExtractor:
 
     def _determine_file_type(self, url: str, filename: str) -> str:
         """Determine file type from URL and filename."""
-        ext = Path(filename).suffix.lower()
-        type_mapping = {
-            '.pdf': 'PDF Document',
-            '.doc': 'Word Document', '.docx': 'Word Document',
-            '.ppt': 'PowerPoint', '.pptx': 'PowerPoint',
-            '.xls': 'Excel Spreadsheet', '.xlsx': 'Excel Spreadsheet',
-            '.txt': 'Text File', '.zip': 'Archive',
-            '.jpg': 'Image', '.jpeg': 'Image', '.png': 'Image', '.gif': 'Image',
-        }
-        return type_mapping.get(ext, 'File')
-
-    def _extract_file_size(self, link) -> Optional[str]:
-        """Extract file size from link text or nearby elements."""
+        return _FILE_TYPES.get(os.path.splitext(filename)[1].lower(), 'File')
+
+    def _extract_file_size(self, link, link_text: str) -> Optional[str]:
+        """Extract file size from link text (as read by _prepare_link) or nearby elements."""
         try:
-            text = link.get_text()
-            size_match = re.search(r'\(([0-9.]+\s*[KMGT]?B)\)', text)
+            size_match = _SIZE_IN_PARENS_RE.search(link_text)
             if size_match:
                 return size_match.group(1)
 
             parent = link.parent
             if parent:
                 parent_text = parent.get_text()
-                size_match = re.search(r'\b([0-9.]+\s*[KMGT]?B)\b', parent_text)
+                size_match = _SIZE_RE.search(parent_text)
                 if size_match:
                     return size_match.group(1)
             return None
@@ -317,35 +830,69 @@ class WebContentExtractor:
             return []
 
         try:
-            # Construct module URL
-            if not self.base_url:
-                self.base_url = self._detect_canvas_url()
-
-            module_url = f"{self.base_url}/courses/{course_id}/modules/{module_id}"
+            module_url = self._get_module_url(course_id, module_id)
 
             self.logger.info(f"Extracting files from module",
                              course_id=course_id,
                              module_id=module_id,
                              url=module_url)
 
-            # Fetch the module page
-            response = self.session.get(module_url, timeout=30)
-            response.raise_for_status()
+            # Fetch the module page, revalidating a previously fetched copy
+            response = self.session.get(module_url, headers=self._conditional_headers(module_url), timeout=30)
+            if response.status_code != 304:
+                response.raise_for_status()
+
+            return self._files_from_module_page(module_url, module_id, course_id,
+                                                response.status_code, response.headers, response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to extract module files",
+                              course_id=course_id,
+                              module_id=module_id,
+                              exception=e)
+            return []
+
+    async def extract_module_files_async(self, course_id: str, module_id: str,
+                                         session=None) -> List[FileInfo]:
+        """
+        Extract files from a Canvas module without blocking the event loop.
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+        The page is fetched with aiohttp; parsing and Canvas API resolution
+        are blocking and run in the default executor. Without aiohttp the
+        whole synchronous extraction runs in the executor instead.
 
-            # Extract files from the page
-            files = []
-            files.extend(self._extract_from_module_items(soup, course_id))
-            files.extend(self._extract_from_attachments(soup, course_id))
-            files.extend(self._extract_from_direct_links(soup, course_id))
+        Args:
+            course_id: Canvas course ID
+            module_id: Canvas module ID
+            session: Session from async_session() to reuse (optional)
 
-            self.logger.info(f"Found {len(files)} files in module",
+        Returns:
+            List[FileInfo]: List of files found in the module
+        """
+        loop = asyncio.get_running_loop()
+
+        if not AIOHTTP_AVAILABLE or not BEAUTIFULSOUP_AVAILABLE:
+            return await loop.run_in_executor(None, self.extract_module_files, course_id, module_id)
+
+        try:
+            module_url = self._get_module_url(course_id, module_id)
+
+            self.logger.info(f"Extracting files from module",
+                             course_id=course_id,
                              module_id=module_id,
-                             files=[f.filename for f in files])
+                             url=module_url)
+
+            # Fetch the module page, revalidating a previously fetched copy
+            async with self.async_session(session) as http:
+                async with http.get(module_url, headers=self._conditional_headers(module_url),
+                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    content = b''
+                    if response.status != 304:
+                        response.raise_for_status()
+                        content = await response.read()
 
-            return files
+            return await loop.run_in_executor(None, self._files_from_module_page, module_url, module_id,
+                                              course_id, response.status, response.headers, content)
 
         except Exception as e:
             self.logger.error(f"Failed to extract module files",
@@ -354,6 +901,137 @@ class WebContentExtractor:
                               exception=e)
             return []
 
+    async def extract_many_modules(self, course_id: str, module_ids: List[str]) -> Dict[str, List[FileInfo]]:
+        """
+        Extract files from several modules of a course concurrently.
+
+        At most MODULE_FETCH_CONCURRENCY module pages are fetched at once,
+        over one shared HTTP session. Repeated module IDs are fetched once.
+
+        Args:
+            course_id: Canvas course ID
+            module_ids: Canvas module IDs
+
+        Returns:
+            Dict[str, List[FileInfo]]: Files found, keyed by module ID
+        """
+        # Fetch each module once, keeping the caller's order
+        module_ids = list(dict.fromkeys(module_ids))
+        semaphore = asyncio.Semaphore(MODULE_FETCH_CONCURRENCY)
+
+        async with self.async_session() as http:
+            async def extract(module_id: str) -> List[FileInfo]:
+                async with semaphore:
+                    return await self.extract_module_files_async(course_id, module_id, session=http)
+
+            results = await asyncio.gather(*(extract(module_id) for module_id in module_ids))
+
+        return dict(zip(module_ids, results))
+
+    @asynccontextmanager
+    async def async_session(self, session=None):
+        """
+        Async context manager yielding an aiohttp session for this extractor.
+
+        A new session carries the cookies of the requests session, with the
+        same domain, path and secure scope, and is closed on exit; a session passed in is
+        yielded as is and left open. Yields None when aiohttp is not
+        installed, which the async methods accept.
+
+        Args:
+            session: Existing session to reuse (optional)
+        """
+        if session is not None or not AIOHTTP_AVAILABLE:
+            yield session
+            return
+
+        cookie_jar = aiohttp.CookieJar()
+        for cookie in self.session.cookies:
+            host = cookie.domain.lstrip('.')
+            if not host:
+                continue
+
+            morsel = http.cookies.Morsel()
+            morsel.set(cookie.name, cookie.value, cookie.value)
+            morsel['path'] = cookie.path or '/'
+            morsel['secure'] = bool(cookie.secure)
+
+            if cookie.domain.startswith('.'):
+                # Domain cookie: also sent to subdomains, e.g. canvas.school.edu
+                morsel['domain'] = host
+                cookie_jar.update_cookies({cookie.name: morsel})
+            else:
+                # Host-only cookie: taken as set by a response from that host
+                cookie_jar.update_cookies({cookie.name: morsel},
+                                          response_url=URL(f"https://{host}{morsel['path']}"))
+
+        session = aiohttp.ClientSession(cookie_jar=cookie_jar, headers=dict(self.session.headers))
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    def _files_from_module_page(self, module_url: str, module_id: str, course_id: str,
+                                status: int, headers, content: bytes) -> List[FileInfo]:
+        """
+        Get the files of a fetched module page.
+
+        A 304 reuses the links parsed from the page before; otherwise the
+        page is parsed and kept for revalidation. Links are resolved either
+        way. Shared by the sync and async extraction paths.
+
+        Args:
+            module_url: Module page URL
+            module_id: Canvas module ID
+            course_id: Canvas course ID
+            status: HTTP status of the (successful or 304) response
+            headers: Response headers
+            content: Response body (unused on a 304)
+
+        Returns:
+            List[FileInfo]: Files found in the module
+        """
+        if status == 304:
+            page_links = self._page_cache[module_url][2]
+        else:
+            page_links = self._parse_page_links(content)
+            self._remember_page(module_url, headers, page_links)
+
+        files = self._build_file_infos(page_links, course_id)
+
+        self.logger.info(f"Found {len(files)} files in module",
+                         module_id=module_id,
+                         files=[f.filename for f in files])
+
+        return files
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Get If-None-Match/If-Modified-Since headers for a previously fetched page."""
+        cached = self._page_cache.get(url)
+        if not cached:
+            return {}
+
+        etag, last_modified, _ = cached
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _remember_page(self, url: str, headers, page_links: List[Tuple]) -> None:
+        """Keep the links parsed from a page for revalidation if the server sent validators."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self._page_cache[url] = (etag, last_modified, page_links)
+        else:
+            self._page_cache.pop(url, None)
+
+    def _get_module_url(self, course_id: str, module_id: str) -> str:
+        """Build the web URL of a module page."""
+        return f"{self.base_url}/courses/{course_id}/modules/{module_id}"
+
     def _detect_canvas_url(self) -> str:
         """Auto-detect Canvas base URL from cookies."""
         for cookie in self.session.cookies:
@@ -362,75 +1040,117 @@ class WebContentExtractor:
                 return f"https://{domain}"
         return "https://canvas.instructure.com"
 
-    def _extract_from_module_items(self, soup: BeautifulSoup, course_id: str) -> List[FileInfo]:
-        """Extract files from module item elements."""
-        files = []
-        module_items = soup.find_all(['div', 'li'], class_=re.compile(r'.*module.*item.*|.*context_module_item.*'))
+    def _collect_file_links(self, soup: BeautifulSoup) -> List[Tuple[Any, str]]:
+        """
+        Collect candidate file links, with their module title, in one pass over the page.
+
+        Links are grouped as module item files, attachment files and other
+        direct file links, in that order, and each href is kept once. Module
+        item links take the title of their outermost module item.
+
+        Elements are visited in document order, so every element inherits
+        its enclosing module item and attachment section from its parent.
+        Classes are matched against the space-joined class string, as
+        BeautifulSoup's class_ filters do.
+
+        Returns:
+            List[Tuple[Any, str]]: (link element, module name) pairs
+        """
+        module_links = []
+        attachment_links = []
+        direct_links = []
+        title_headings = []
+        context = {}  # id(element) -> (outermost module item, inside an attachment section)
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
 
-        for item in module_items:
             try:
-                file_links = item.find_all('a', href=re.compile(r'.*/files/.*|.*\.pdf|.*\.docx?|.*\.pptx?|.*\.xlsx?'))
-                for link in file_links:
-                    file_info = self._extract_file_info_from_link(link, course_id)
-                    if file_info:
-                        module_title = self._find_module_title(item)
-                        if module_title:
-                            file_info.module_name = module_title
-                        files.append(file_info)
+                module_item, in_attachment = context.get(id(element.parent), (None, False))
+                name = element.name
+
+                if name == 'a':
+                    href = element.get('href')
+                    if href is None:
+                        continue
+
+                    if module_item is not None and _MODULE_ITEM_FILE_HREF_RE.search(href):
+                        module_links.append((element, module_item))
+
+                    if self._is_file_link(href):
+                        (attachment_links if in_attachment else direct_links).append((element, ""))
+                    continue
+
+                classes = element.get('class')
+                if classes:
+                    class_string = ' '.join(classes) if isinstance(classes, list) else classes
+                    if name in ('div', 'li') and module_item is None and _MODULE_ITEM_CLASS_RE.search(class_string):
+                        module_item = element
+                    if name in ('div', 'section') and _ATTACHMENT_CLASS_RE.search(class_string):
+                        in_attachment = True
+                    if name in ('h1', 'h2', 'h3') and _MODULE_TITLE_CLASS_RE.search(class_string):
+                        title_headings.append(element)
+
+                if module_item is not None or in_attachment:
+                    context[id(element)] = (module_item, in_attachment)
+
             except Exception as e:
-                self.logger.debug(f"Error processing module item", exception=e)
+                self.logger.debug(f"Error processing page element: {e}")
                 continue
-        return files
-
-    def _extract_from_attachments(self, soup: BeautifulSoup, course_id: str) -> List[FileInfo]:
-        """Extract files from attachment sections."""
-        files = []
-        attachment_sections = soup.find_all(['div', 'section'], class_=re.compile(r'.*attachment.*|.*file.*'))
-
-        for section in attachment_sections:
-            links = section.find_all('a', href=True)
-            for link in links:
-                if self._is_file_link(link.get('href', '')):
-                    file_info = self._extract_file_info_from_link(link, course_id)
-                    if file_info:
-                        files.append(file_info)
-        return files
 
-    def _extract_from_direct_links(self, soup: BeautifulSoup, course_id: str) -> List[FileInfo]:
-        """Extract direct file links from anywhere on the page."""
-        files = []
-        all_links = soup.find_all('a', href=True)
+        if module_links:
+            module_titles = self._index_module_titles(title_headings)
+            module_links = [(link, self._find_module_title(module_item, module_titles))
+                            for link, module_item in module_links]
 
-        for link in all_links:
-            href = link.get('href', '')
-            if self._is_file_link(href):
-                file_info = self._extract_file_info_from_link(link, course_id)
-                if file_info:
-                    files.append(file_info)
-        return files
+        candidates = {}
+        for link, module_name in module_links + attachment_links + direct_links:
+            candidates.setdefault(link.get('href', ''), (link, module_name))
+        return list(candidates.values())
 
     def _is_file_link(self, href: str) -> bool:
         """Check if a href looks like a file download link."""
         if not href:
             return False
 
-        file_patterns = [
-            r'/files/\d+',  # Canvas file ID pattern
-            r'\.pdf($|\?)', r'\.docx?($|\?)', r'\.pptx?($|\?)', r'\.xlsx?($|\?)',
-            r'\.txt($|\?)', r'\.zip($|\?)', r'\.jpg($|\?)', r'\.png($|\?)'
-        ]
-        return any(re.search(pattern, href, re.IGNORECASE) for pattern in file_patterns)
+        return _FILE_LINK_RE.search(href) is not None
+
+    def _index_module_titles(self, headings: List[Any]) -> Dict[int, str]:
+        """
+        Map elements to the first module title heading they contain.
+
+        One pass over the title headings replaces a subtree search from every
+        ancestor of every module item.
+
+        Args:
+            headings: Module title headings, in document order
 
-    def _find_module_title(self, element) -> str:
+        Returns:
+            Dict[int, str]: id() of each heading ancestor -> title text
+        """
+        module_titles = {}
+        for heading in headings:
+            title = None
+            for ancestor in heading.parents:
+                if id(ancestor) in module_titles:
+                    # An earlier heading already claimed this ancestor and all above it
+                    break
+                if title is None:
+                    title = heading.get_text(strip=True)
+                module_titles[id(ancestor)] = title
+        return module_titles
+
+    def _find_module_title(self, element, module_titles: Dict[int, str]) -> str:
         """Find module title from element context."""
         try:
             current = element
             for _ in range(5):  # Look up 5 levels
                 if current is None:
                     break
-                title_elem = current.find(['h1', 'h2', 'h3'], class_=re.compile(r'.*module.*title.*'))
-                if title_elem:
-                    return title_elem.get_text(strip=True)
+                title = module_titles.get(id(current))
+                if title is not None:
+                    return title
                 current = current.parent
             return ""
         except Exception:
@@ -457,28 +1177,18 @@ class WebContentExtractor:
                                      url=url,
                                      filepath=str(filepath))
 
-                    response = self.session.get(url, stream=True, timeout=60)
+                    response = self._download_session.get(url, stream=True, timeout=60)
                     response.raise_for_status()
 
                     with open(filepath, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-
-                    if filepath.exists() and filepath.stat().st_size > 0:
-                        self.logger.info(f"File downloaded successfully",
-                                         filepath=str(filepath),
-                                         size=filepath.stat().st_size)
-                        return True
-                    else:
-                        raise Exception("Downloaded file is empty or missing")
+                        # Undo any Content-Encoding and copy in large blocks
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+
+                    return self._check_downloaded_file(filepath)
 
                 except Exception as e:
-                    self.logger.warning(f"Download attempt {attempt + 1} failed", exception=e)
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        raise
+                    time.sleep(self._download_retry_delay(attempt, max_retries, e))
 
             return False
 
@@ -489,17 +1199,157 @@ class WebContentExtractor:
                               exception=e)
             return False
 
+    async def download_file_async(self, url: str, filepath: Path, max_retries: int = 3,
+                                  session=None) -> bool:
+        """
+        Download a file from URL to filepath without blocking the event loop.
+
+        Streams the response with aiohttp into aiofiles. Without aiohttp the
+        synchronous download runs in the default executor instead.
+
+        Args:
+            url: File download URL
+            filepath: Local path to save file
+            max_retries: Maximum download attempts
+            session: Session from async_session() to reuse (optional)
+
+        Returns:
+            bool: True if download successful
+        """
+        if not AIOHTTP_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.download_file, url, filepath, max_retries)
+
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+
+            async with self.async_session(session) as http:
+                for attempt in range(max_retries):
+                    try:
+                        self.logger.info(f"Downloading file (attempt {attempt + 1})",
+                                         url=url,
+                                         filepath=str(filepath))
+
+                        async with http.get(url, timeout=aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=60)) as response:
+                            response.raise_for_status()
+
+                            async with aiofiles.open(filepath, 'wb') as f:
+                                async for chunk in response.content.iter_chunked(ASYNC_DOWNLOAD_CHUNK_SIZE):
+                                    await f.write(chunk)
+
+                        return self._check_downloaded_file(filepath)
+
+                    except Exception as e:
+                        await asyncio.sleep(self._download_retry_delay(attempt, max_retries, e))
+
+            return False
+
+        except Exception as e:
+            self.logger.error(f"Failed to download file",
+                              url=url,
+                              filepath=str(filepath),
+                              exception=e)
+            return False
+
+    def _check_downloaded_file(self, filepath: Path) -> bool:
+        """
+        Check that a download produced a non-empty file and log it.
+
+        Raises:
+            Exception: If the file is empty or missing
+        """
+        size = filepath.stat().st_size if filepath.exists() else 0
+        if not size:
+            raise Exception("Downloaded file is empty or missing")
+
+        self.logger.info(f"File downloaded successfully",
+                         filepath=str(filepath),
+                         size=size)
+        return True
+
+    def _download_retry_delay(self, attempt: int, max_retries: int, error: Exception) -> float:
+        """
+        Log a failed download attempt and get the delay before the next one.
+
+        Raises:
+            Exception: The attempt's error, if it was the last attempt
+        """
+        self.logger.warning(f"Download attempt {attempt + 1} failed", exception=error)
+        if attempt >= max_retries - 1:
+            raise error
+        return _retry_delay(attempt, error)
+
+    def download_files(self, jobs: List[Tuple[str, Path]], max_workers: int = DOWNLOAD_MAX_WORKERS,
+                       progress_callback: Optional[Callable[[str, Path, bool], None]] = None) -> List[bool]:
+        """
+        Download several files concurrently over the shared session.
+
+        Args:
+            jobs: (url, filepath) pairs to download
+            max_workers: Maximum downloads in flight
+            progress_callback: Called with (url, filepath, success) as each download finishes
+
+        Returns:
+            List[bool]: Success of each job, in job order
+        """
+        def download(job: Tuple[str, Path]) -> bool:
+            url, filepath = job
+            success = self.download_file(url, filepath)
+            if progress_callback:
+                progress_callback(url, filepath, success)
+            return success
+
+        if len(jobs) <= 1:
+            return [download(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)),
+                                thread_name_prefix='download-file') as executor:
+            return list(executor.map(download, jobs))
+
+    async def download_files_async(self, jobs: List[Tuple[str, Path]], max_concurrent: int = DOWNLOAD_MAX_WORKERS,
+                                   session=None,
+                                   progress_callback: Optional[Callable[[str, Path, bool], None]] = None) -> List[bool]:
+        """
+        Download several files concurrently without blocking the event loop.
+
+        Args:
+            jobs: (url, filepath) pairs to download
+            max_concurrent: Maximum downloads in flight
+            session: Session from async_session() to reuse (optional)
+            progress_callback: Called with (url, filepath, success) as each download finishes
+
+        Returns:
+            List[bool]: Success of each job, in job order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async with self.async_session(session) as http:
+            async def download(url: str, filepath: Path) -> bool:
+                async with semaphore:
+                    success = await self.download_file_async(url, filepath, session=http)
+                if progress_callback:
+                    progress_callback(url, filepath, success)
+                return success
+
+            return list(await asyncio.gather(*(download(url, filepath) for url, filepath in jobs)))
+
 
 def create_web_content_extractor(cookies_path: str = "config/cookies.txt",
-                                 canvas_client=None) -> WebContentExtractor:
+                                 canvas_client=None,
+                                 resolution_cache_path: Optional[Path] = None,
+                                 resolution_cache_ttl_hours: int = 24) -> WebContentExtractor:
     """
     Factory function to create a web content extractor.
 
     Args:
         cookies_path: Path to browser cookies file
         canvas_client: Canvas API client for URL resolution
+        resolution_cache_path: JSON file persisting module item resolutions (optional)
+        resolution_cache_ttl_hours: Age after which persisted resolutions are ignored
 
     Returns:
         WebContentExtractor: Configured extractor instance
     """
-    return WebContentExtractor(cookies_path=cookies_path, canvas_client=canvas_client)
\ No newline at end of file
+    return WebContentExtractor(cookies_path=cookies_path, canvas_client=canvas_client,
+                               resolution_cache_path=resolution_cache_path,
+                               resolution_cache_ttl_hours=resolution_cache_ttl_hours)
\ No newline at end of file